@@ -31,7 +31,7 @@ def create_test_axis_pack(artifacts_dir: Path, pack_id: str):
     weights = np.array([1.0], dtype=np.float32)
     
     npz_path = artifacts_dir / f"axis_pack_{pack_id}.npz"
-    np.savez_compressed(npz_path, Q=Q, lambda_=lambda_, beta=beta, weights=weights)
+    np.savez(npz_path, Q=Q, lambda_=lambda_, beta=beta, weights=weights)
     
     meta_data = {
         "schema_version": "axis-pack/1.1",
@@ -68,7 +68,7 @@ def create_test_axis_pack(artifacts_dir: Path, pack_id: str, num_axes: int = 1,
     weights = np.ones(num_axes, dtype=np.float32)
     
     npz_path = artifacts_dir / f"axis_pack_{pack_id}.npz"
-    np.savez_compressed(npz_path, Q=Q, lambda_=lambda_, beta=beta, weights=weights)
+    np.savez(npz_path, Q=Q, lambda_=lambda_, beta=beta, weights=weights)
     
     axis_names = [f"axis_{i}" for i in range(num_axes)]
     thresholds = {name: 0.1 + i * 0.05 for i, name in enumerate(axis_names)}
@@ -438,7 +438,7 @@ def test_data_validation(client: TestClient, artifacts_dir: Path, results: TestR
         Q = Q / np.linalg.norm(Q, axis=0)
         
         npz_path = artifacts_dir / f"axis_pack_{pack_id}.npz"
-        np.savez_compressed(npz_path, Q=Q, lambda_=np.array([1.0]), 
+        np.savez(npz_path, Q=Q, lambda_=np.array([1.0]), 
                            beta=np.array([0.0]), weights=np.array([1.0]))
         
         meta_data = {
@@ -105,7 +105,9 @@ class AxisRegistry:
             raise FileNotFoundError(f"Axis pack {pack_id} not found")
         pack_hash = self._hash_file(npz_p)
         meta = json.loads(meta_p.read_text(encoding="utf-8"))
-        npz = np.load(npz_p)
+        # read every member up front and close the archive (np.load keeps the file open)
+        with np.load(npz_p, allow_pickle=False) as f:
+            npz = {k: f[k] for k in f.files}
 
         # --- Load Q and auxiliary arrays with backward-compat handling ---
         has_Q = "Q" in npz
@@ -116,7 +118,7 @@ class AxisRegistry:
         else:
             # Legacy/minimal artifact: reconstruct Q from any non-reserved keys
             reserved = {"lambda_", "beta", "weights"}
-            vector_keys = [k for k in getattr(npz, "files", []) if k not in reserved]
+            vector_keys = [k for k in npz if k not in reserved]
             if not vector_keys:
                 raise ValueError("No axis vectors found in artifact npz and no 'Q' present")
             # Consistent key ordering for determinism
@@ -210,6 +212,12 @@ class AxisRegistry:
 REGISTRY: Optional[AxisRegistry] = None
 
 
+def reset() -> None:
+    """Drop the global registry; the next init_registry() builds a fresh one."""
+    global REGISTRY
+    REGISTRY = None
+
+
 def init_registry(encoder_dim: int, artifacts_dir: Optional[str] = None) -> AxisRegistry:
     global REGISTRY
     artifacts_path = Path(artifacts_dir or DEFAULT_ARTIFACTS_DIR)
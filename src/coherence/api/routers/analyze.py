@@ -58,7 +58,7 @@ def analyze(req: AnalyzeText) -> AnalyzeResponse:
         )
 
     enc = get_default_encoder()
-    X = enc.encode(tokens).astype(np.float32)  # (n,d) or (d,)
+    X = np.asarray(enc.encode(tokens), dtype=np.float32)  # (n,d) or (d,)
     if X.ndim == 1:
         X = X.reshape(1, -1)
     if X.shape[1] != pack.Q.shape[0]:
@@ -77,9 +77,9 @@ def analyze(req: AnalyzeText) -> AnalyzeResponse:
         a = project(X[i], pack)
         u = utilities(a, pack)
         U = float(aggregate(u, pack))
-        alpha_toks.append(a.astype(np.float32).tolist())
-        u_toks.append(u.astype(np.float32).tolist())
-        r_toks.append(u.astype(np.float32).tolist())  # TODO: gating t, r
+        alpha_toks.append(np.asarray(a, dtype=np.float32).tolist())
+        u_toks.append(np.asarray(u, dtype=np.float32).tolist())
+        r_toks.append(np.asarray(u, dtype=np.float32).tolist())  # TODO: gating t, r
         U_toks.append(U)
 
     tokens_out = TokenVectors(alpha=alpha_toks, u=u_toks, r=r_toks, U=U_toks)
@@ -94,9 +94,9 @@ def analyze(req: AnalyzeText) -> AnalyzeResponse:
         u = utilities(a, pack)
         U = float(aggregate(u, pack))
         vec = AxialVectorsModel(
-            alpha=a.astype(np.float32).tolist(),
-            u=u.astype(np.float32).tolist(),
-            r=u.astype(np.float32).tolist(),
+            alpha=np.asarray(a, dtype=np.float32).tolist(),
+            u=np.asarray(u, dtype=np.float32).tolist(),
+            r=np.asarray(u, dtype=np.float32).tolist(),
             U=U,
             C=float(C),
             t=1.0,
@@ -121,9 +121,9 @@ def analyze(req: AnalyzeText) -> AnalyzeResponse:
         u = utilities(a, pack)
         U = float(aggregate(u, pack))
         fv = AxialVectorsModel(
-            alpha=a.astype(np.float32).tolist(),
-            u=u.astype(np.float32).tolist(),
-            r=u.astype(np.float32).tolist(),
+            alpha=np.asarray(a, dtype=np.float32).tolist(),
+            u=np.asarray(u, dtype=np.float32).tolist(),
+            r=np.asarray(u, dtype=np.float32).tolist(),
             U=U,
             t=1.0,
             tau=0.0,
@@ -135,9 +135,9 @@ def analyze(req: AnalyzeText) -> AnalyzeResponse:
         pu = utilities(pa, pack)
         pU = float(aggregate(pu, pack))
         pvec = AxialVectorsModel(
-            alpha=pa.astype(np.float32).tolist(),
-            u=pu.astype(np.float32).tolist(),
-            r=pu.astype(np.float32).tolist(),
+            alpha=np.asarray(pa, dtype=np.float32).tolist(),
+            u=np.asarray(pu, dtype=np.float32).tolist(),
+            r=np.asarray(pu, dtype=np.float32).tolist(),
             U=pU,
             C=None,
             t=1.0,
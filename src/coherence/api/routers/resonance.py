@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import base64
+import binascii
 from typing import List, Optional
 
 import numpy as np
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from coherence.axis.pack import AxisPack
 import coherence.api.axis_registry as axis_registry
@@ -16,17 +18,40 @@ router = APIRouter()
 
 class AxisPackModel(BaseModel):
     names: List[str]
-    Q: List[List[float]]
+    Q: Optional[List[List[float]]] = None
+    Q_b64: Optional[str] = Field(
+        None, description="Alternative to Q: base64 of the C-order float32 (d, k) matrix, k = len(names)"
+    )
     lambda_: Optional[List[float]] = Field(None, alias="lambda")
     beta: Optional[List[float]] = None
     weights: Optional[List[float]] = None
     mu: Optional[dict] = None
     meta: Optional[dict] = None
+    _Q_arr: Optional[np.ndarray] = PrivateAttr(None)
+
+    @model_validator(mode="after")
+    def _one_Q(self) -> "AxisPackModel":
+        if (self.Q is None) == (self.Q_b64 is None):
+            raise ValueError("axis_pack needs exactly one of Q or Q_b64")
+        if self.Q_b64 is not None:
+            try:
+                raw = base64.b64decode(self.Q_b64, validate=True)
+            except binascii.Error as e:
+                raise ValueError(f"Q_b64 is not valid base64: {e}") from e
+            k = len(self.names)
+            if k == 0 or len(raw) % (4 * k):
+                raise ValueError("Q_b64 must hold d * len(names) float32 values")
+            # raw float32 bytes: no per-element JSON number parsing
+            self._Q_arr = np.frombuffer(raw, dtype=np.float32).reshape(-1, k)
+        return self
+
+    def _Q(self):
+        return self._Q_arr if self._Q_arr is not None else self.Q
 
     def to_axis_pack(self) -> AxisPack:
         obj = {
             "names": self.names,
-            "Q": self.Q,
+            "Q": self._Q(),
             "lambda": self.lambda_ if self.lambda_ is not None else [1.0] * len(self.names),
             "beta": self.beta if self.beta is not None else [0.0] * len(self.names),
             "weights": self.weights if self.weights is not None else [1.0 / max(1, len(self.names))] * len(self.names),
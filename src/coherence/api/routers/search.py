@@ -67,35 +67,29 @@ def search(req: SearchRequest) -> SearchResponse:
     recall_k = int(req.top_k) * 4
     idxs, _ = ann_query(axis_pack_id, u_q, recall_k)
     payloads = get_payloads(axis_pack_id)
-    cands = [payloads[i] for i in idxs if i < len(payloads)]
+    cand = np.asarray([i for i in idxs if 0 <= i < len(payloads)], dtype=np.int64)
 
-    # Filters
+    # Filters (vectorized over the payload columns)
     minC = float(req.filters.minC)
     thr = req.filters.thresholds or {}
     # Map thresholds by axis index if provided by name
     thr_idx = np.full((pack.k,), -np.inf, dtype=np.float32)
-    for name, val in thr.items():
-        if name in pack.names:
-            thr_idx[pack.names.index(name)] = float(val)
-    filtered = []
-    for c in cands:
-        if float(c.get("C", 0.0)) < minC:
-            continue
-        uvec = np.asarray(c["u"], dtype=np.float32)
-        if np.any(uvec < thr_idx):
-            continue
-        filtered.append(c)
+    if thr:
+        pos: Dict[str, int] = {}
+        for i, n in enumerate(pack.names):
+            pos.setdefault(n, i)  # first occurrence, as list.index would
+        for name, val in thr.items():
+            if name in pos:
+                thr_idx[pos[name]] = float(val)
+    c_ok = payloads.col("C")[cand] >= minC
+    u_cand = payloads.col("u")[cand]
+    keep = cand[c_ok & np.all(u_cand >= thr_idx, axis=1)]
 
     # If empty, relax thresholds by 20%
-    if not filtered and thr:
+    if keep.size == 0 and thr:
         thr_idx *= 0.8
-        for c in cands:
-            if float(c.get("C", 0.0)) < minC:
-                continue
-            uvec = np.asarray(c["u"], dtype=np.float32)
-            if np.any(uvec < thr_idx):
-                continue
-            filtered.append(c)
+        keep = cand[c_ok & np.all(u_cand >= thr_idx, axis=1)]
+    filtered = [payloads.get_payload(int(i)) for i in keep]
 
     # Rerank
     scored = [(_score_candidate(u_q, c, pack.names, req.hyper.model_dump(), w_vec), c) for c in filtered]
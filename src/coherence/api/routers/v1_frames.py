@@ -32,6 +32,15 @@ def get_store() -> FrameStore:
     return _STORE  # type: ignore[return-value]
 
 
+def reset_store() -> None:
+    """Close the cached frame store; the next get_store() reopens it for the current artifacts dir."""
+    global _STORE, _STORE_DB_PATH
+    if _STORE is not None:
+        _STORE.conn.close()
+    _STORE = None
+    _STORE_DB_PATH = None
+
+
 # ======== Models ========
 class FrameItem(BaseModel):
     id: str
@@ -126,9 +135,10 @@ def _axis_to_index(axis: Union[str, int], names: List[str]) -> int:
         return int(axis)
     except (TypeError, ValueError):
         pass
-    if axis in names:
-        return names.index(axis)
-    raise HTTPException(status_code=422, detail=f"Axis not found: {axis}")
+    try:
+        return names.index(axis)  # one scan; no separate membership test
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Axis not found: {axis}") from None
 
 
 # ======== Routes ========
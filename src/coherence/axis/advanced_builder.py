@@ -20,6 +20,7 @@ from pathlib import Path
 from typing import Dict, FrozenSet, Iterable, List, Optional, Union, Sequence, Tuple
 
 import numpy as np
+import orjson
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 from sklearn.covariance import EmpiricalCovariance, ledoit_wolf, LedoitWolf
 from sklearn.decomposition import PCA
@@ -31,16 +32,17 @@ logger = logging.getLogger(__name__)
 
 def _load_json_axis_config(path: Union[str, Path]) -> dict:
     """Load and validate an axis configuration from JSON."""
-    with open(path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
-    
-    # Validate required fields
+    config = orjson.loads(Path(path).read_bytes())
+    _validate_axis_config(config)
+    return config
+
+
+def _validate_axis_config(config: dict) -> None:
+    """Raise ValueError if an axis configuration lacks a required field."""
     required_fields = ['name', 'max_examples', 'min_examples']
     for field in required_fields:
         if field not in config:
             raise ValueError(f"Missing required field in axis config: {field}")
-    
-    return config
 
 
 def _compute_whitening_matrix(vectors: np.ndarray, method: str = 'empirical') -> np.ndarray:
@@ -641,12 +643,37 @@ class AdvancedAxisBuilder:
         """
         logger.info(f"Building axis pack from {len(json_paths)} JSON files")
         
-        # Load and process each axis configuration
-        seeds_vecs = {}
-        
+        configs = []
         for path in json_paths:
             try:
-                config = _load_json_axis_config(path)
+                configs.append(_load_json_axis_config(path))
+            except Exception as e:
+                logger.error(f"Error processing {path}: {e}", exc_info=True)
+                continue
+        
+        return self.build_axis_pack_from_dicts(configs, encode_fn, **kwargs)
+    
+    def build_axis_pack_from_dicts(
+        self,
+        configs: Sequence[dict],
+        encode_fn,
+        **kwargs
+    ) -> AxisPack:
+        """Build an AxisPack from already-parsed axis configurations.
+        
+        Args:
+            configs: Axis configuration dicts, as found in the axis JSON files
+            encode_fn: Function to encode text to vectors
+            **kwargs: Additional arguments to pass to build_axis_pack_from_vectors
+            
+        Returns:
+            AxisPack built from the configurations
+        """
+        # Validate each axis configuration and collect its examples
+        axes: List[Tuple[str, List[str], List[str]]] = []
+        for config in configs:
+            try:
+                _validate_axis_config(config)
                 name = config['name']
                 
                 # Handle both naming conventions
@@ -656,23 +683,13 @@ class AdvancedAxisBuilder:
                 if not max_examples or not min_examples:
                     logger.warning(f"Skipping axis '{name}': missing required examples")
                     continue
-                
-                logger.debug(f"  Encoding {len(max_examples)} positive examples for axis '{name}'...")
-                pos_vectors = encode_fn(max_examples)
-                logger.debug(f"  Encoded positive vectors shape: {pos_vectors.shape if hasattr(pos_vectors, 'shape') else 'N/A'}")
-                
-                logger.debug(f"  Encoding {len(min_examples)} negative examples for axis '{name}'...")
-                neg_vectors = encode_fn(min_examples)
-                logger.debug(f"  Encoded negative vectors shape: {neg_vectors.shape if hasattr(neg_vectors, 'shape') else 'N/A'}")
-                
-                seeds_vecs[name] = (pos_vectors, neg_vectors)
-                logger.info(f"  Successfully processed axis: {name} with {len(max_examples)} positive "
-                          f"and {len(min_examples)} negative vectors")
-                
+                axes.append((name, list(max_examples), list(min_examples)))
             except Exception as e:
-                logger.error(f"Error processing {path}: {e}", exc_info=True)
+                logger.error(f"Error processing axis '{config.get('name', '?')}': {e}", exc_info=True)
                 continue
         
+        seeds_vecs = self._encode_seed_examples(axes, encode_fn)
+        
         if not seeds_vecs:
             raise ValueError("No valid axis configurations found in the provided JSON files")
         
@@ -690,6 +707,43 @@ class AdvancedAxisBuilder:
             logger.error(f"Error in build_axis_pack_from_vectors: {e}", exc_info=True)
             raise
     
+    def _encode_seed_examples(
+        self,
+        axes: Sequence[Tuple[str, List[str], List[str]]],
+        encode_fn,
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Encode every axis's examples with one encode_fn call and split them back.
+        
+        One batched call avoids the per-call tokenizer/model dispatch of encoding
+        each axis's positives and negatives separately. If the batched call fails,
+        axes are encoded one at a time so a single bad axis is skipped, not fatal.
+        """
+        seeds_vecs: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        if not axes:
+            return seeds_vecs
+        flat = [t for _, pos, neg in axes for t in (*pos, *neg)]
+        try:
+            logger.debug(f"  Encoding {len(flat)} examples for {len(axes)} axes in one batch...")
+            E = np.asarray(encode_fn(flat))
+            if E.shape[0] != len(flat):
+                raise ValueError(f"encode_fn returned {E.shape[0]} vectors for {len(flat)} texts")
+        except Exception as e:
+            logger.warning(f"Batched encoding failed ({e}); encoding axes one at a time")
+            for name, pos, neg in axes:
+                try:
+                    seeds_vecs[name] = (encode_fn(pos), encode_fn(neg))
+                except Exception as axis_e:
+                    logger.error(f"Error encoding axis '{name}': {axis_e}", exc_info=True)
+            return seeds_vecs
+        
+        # [pos_0, neg_0, pos_1, neg_1, ...] row blocks
+        parts = np.split(E, np.cumsum([n for _, pos, neg in axes for n in (len(pos), len(neg))])[:-1])
+        for i, (name, pos, neg) in enumerate(axes):
+            seeds_vecs[name] = (parts[2 * i], parts[2 * i + 1])
+            logger.info(f"  Successfully processed axis: {name} with {len(pos)} positive "
+                      f"and {len(neg)} negative vectors")
+        return seeds_vecs
+    
     def save_axis_pack(
         self,
         axis_pack: AxisPack,
@@ -45,7 +45,42 @@ def choquet_integral(x: Sequence[float], mu: Dict[FrozenSet[int], float]) -> flo
         prev = xi
     return float(total)
 
-"""Choquet integral for axis aggregation (Milestone 2).
 
-# TODO: @builder implement in Milestone 2
-"""
+def capacity_table(mu: Dict[FrozenSet[int], float], k: int) -> np.ndarray:
+    """Dense capacity lookup of shape (2**k,) indexed by subset bitmask.
+
+    Bit j of the index is set iff axis j is in the subset; subsets absent
+    from `mu` map to 0.0, matching `choquet_integral`.
+    """
+    table = np.zeros((1 << k,), dtype=np.float64)
+    for kset, v in mu.items():
+        idx = 0
+        for j in kset:
+            idx |= 1 << int(j)
+        if idx < table.shape[0]:
+            table[idx] = float(v)
+    return table
+
+
+def choquet_integral_batch(X: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """Vectorized Choquet integral for every row of X.
+
+    Args
+    - X: (n, k) utilities
+    - table: dense capacity from `capacity_table(mu, k)`
+
+    Returns
+    - (n,) float64 array; same ascending-sort formula and tie handling as
+      `choquet_integral`, evaluated for all rows at once.
+    """
+    X = np.asarray(X, dtype=np.float32)
+    n, k = X.shape
+    if k == 0:
+        return np.zeros((n,), dtype=np.float64)
+    xs = np.sort(X, axis=1)
+    # ge[r, i, j]: x_j >= x_(i) for row r -> bitmask of A_i
+    ge = X[:, None, :] >= (xs[:, :, None] - 1e-12)
+    bits = ge.astype(np.int64) @ (np.int64(1) << np.arange(k, dtype=np.int64))
+    xs64 = xs.astype(np.float64)
+    steps = np.diff(xs64, axis=1, prepend=0.0)
+    return (steps * table[bits]).sum(axis=1)
@@ -21,6 +21,7 @@ Determinism:
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, FrozenSet, Iterable, List, Optional, Union
 
@@ -28,6 +29,24 @@ import json
 import logging
 import numpy as np
 
+from coherence.axis.choquet import capacity_table
+
+# Largest k for which the Choquet capacity is expanded to a dense 2**k table
+DENSE_MU_MAX_K = 20
+
+# Numeric fields kept as read-only, C-contiguous float32 arrays
+_TENSOR_FIELDS = ("Q", "lambda_", "beta", "weights")
+
+
+def _frozen_f32(arr: object) -> np.ndarray:
+    """Return `arr` as a read-only C-contiguous float32 array (no copy if already so)."""
+    out = np.ascontiguousarray(arr, dtype=np.float32)
+    if out.flags.writeable:
+        if out is arr:
+            out = out.view()
+        out.setflags(write=False)
+    return out
+
 
 def _mu_to_json(mu: Optional[Dict[FrozenSet[int], float]]) -> Dict[str, float]:
     """Convert Choquet capacity from frozenset keys to JSON-serializable format.
@@ -86,6 +105,9 @@ class AxisPack:
     - weights: (k,) aggregation weights (linear); ignored if mu provided
     - mu: Choquet capacity mapping; empty -> linear aggregation
     - meta: free-form metadata
+
+    Q, lambda_, beta and weights are stored as read-only C-contiguous float32
+    arrays whenever they are assigned, so hot paths never re-cast them.
     """
 
     names: List[str]
@@ -96,6 +118,13 @@ class AxisPack:
     mu: Dict[FrozenSet[int], float]
     meta: Dict[str, object]
 
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in _TENSOR_FIELDS:
+            value = _frozen_f32(value)
+        elif name in ("mu", "names"):
+            self.__dict__.pop("mu_table", None)  # rebuilt lazily from the new mu/k
+        object.__setattr__(self, name, value)
+
     @property
     def k(self) -> int:
         return len(self.names)
@@ -104,6 +133,13 @@ class AxisPack:
     def d(self) -> int:
         return int(self.Q.shape[0])
 
+    @cached_property
+    def mu_table(self) -> Optional[np.ndarray]:
+        """Dense (2**k,) Choquet capacity, built once; None if mu is empty or k is large."""
+        if not self.mu or self.k > DENSE_MU_MAX_K:
+            return None
+        return capacity_table(self.mu, self.k)
+
     def validate(self) -> None:
         k = self.k
         logger = logging.getLogger(__name__)
@@ -135,7 +171,7 @@ class AxisPack:
         self.validate()
         return {
             "names": list(self.names),
-            "Q": self.Q.astype(np.float32).tolist(),
+            "Q": self.Q.tolist(),
             "lambda": self.lambda_.astype(float).tolist(),
             "beta": self.beta.astype(float).tolist(),
             "weights": self.weights.astype(float).tolist(),
@@ -25,7 +25,7 @@ from dataclasses import dataclass
 import os
 import sys
 import hashlib
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 
@@ -38,6 +38,9 @@ except Exception:  # pragma: no cover - import fallback
 # This significantly improves performance in production and testing
 # Cache key: (model_name, resolved_device, normalize_input)
 _ENCODER_CACHE: dict[tuple[str, str, bool], "SBERTEncoder"] = {}
+# Loaded models shared by every SBERTEncoder on the same (model_name, device), so
+# encoders differing only in normalize_input don't load the weights twice
+_MODEL_CACHE: dict[tuple[str, str], "SentenceTransformer"] = {}
 
 def _select_device(device: str) -> str:
     """Select the appropriate compute device for the encoder.
@@ -84,8 +87,12 @@ class SBERTEncoder:
         if SentenceTransformer is None:
             raise RuntimeError("sentence-transformers is not installed")
         dev = _select_device(self.device)
+        model = _MODEL_CACHE.get((self.model_name, dev))
+        if model is not None:
+            self._model = model
+            return
         print(f"[DEBUG] Loading SBERT model: {self.model_name} on device: {dev}")
-        self._model = SentenceTransformer(self.model_name, device=dev)
+        self._model = _MODEL_CACHE[(self.model_name, dev)] = SentenceTransformer(self.model_name, device=dev)
         # Print model info for debugging
         print(f"[DEBUG] Model max sequence length: {self._model.max_seq_length}")
         print(f"[DEBUG] Model device: {self._model.device}")
@@ -146,20 +153,31 @@ def get_default_encoder(name: Optional[str] = None, device: str = "auto", normal
                 self.device = device
                 self.normalize_input = normalize_input
                 self._model = _StubModel()
+                # text -> embedding; seeding a Generator per text dominates stub cost
+                self._memo: Dict[str, np.ndarray] = {}
+
+            def _embed(self, t: str, d: int) -> np.ndarray:
+                h = hashlib.sha256(t.encode("utf-8")).digest()
+                seed = int.from_bytes(h[:8], "little", signed=False)
+                rng = np.random.default_rng(seed)
+                vec = rng.random(d, dtype=np.float32)
+                # Optional simple normalization to mimic unit-length embeddings
+                norm = np.sqrt(np.dot(vec, vec))  # 1-D dot skips linalg.norm's dispatch
+                if norm > 0:
+                    vec /= norm
+                return vec
 
             def encode(self, texts: List[str]) -> np.ndarray:
                 # Deterministic per-text embeddings derived from SHA-256 of text
                 d = self._model.get_sentence_embedding_dimension()
                 out = np.zeros((len(texts), d), dtype=np.float32)
+                memo = self._memo
                 for i, t in enumerate(texts):
-                    h = hashlib.sha256(t.encode("utf-8")).digest()
-                    seed = int.from_bytes(h[:8], "little", signed=False)
-                    rng = np.random.default_rng(seed)
-                    vec = rng.random(d, dtype=np.float32)
-                    # Optional simple normalization to mimic unit-length embeddings
-                    norm = float(np.linalg.norm(vec))
-                    if norm > 0:
-                        vec = vec / norm
+                    vec = memo.get(t)
+                    if vec is None:
+                        if len(memo) >= 8192:
+                            memo.clear()
+                        vec = memo[t] = self._embed(t, d)
                     out[i] = vec
                 return out
 
@@ -6,7 +6,7 @@ Compute simple role-aware embeddings by averaging token vectors over
 role spans and concatenating in a fixed role order.
 """
 
-from typing import Iterable, List, Sequence
+from typing import Iterable, Optional, Sequence
 
 import numpy as np
 
@@ -25,18 +25,25 @@ def frame_embedding(
     token_vectors: np.ndarray,
     frame: Frame,
     roles_order: Sequence[str] = ("predicate", "arg_left", "arg_right"),
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Concatenate mean vectors of roles in roles_order.
 
-    Missing roles are zero vectors of dim d.
+    Missing roles are zero vectors of dim d. If `out` (a float32 buffer of
+    length len(roles_order) * d, e.g. a row of a preallocated matrix) is
+    given, the result is written into it in place and returned.
     """
     d = token_vectors.shape[1]
-    parts: List[np.ndarray] = []
-    for role in roles_order:
+    if out is None:
+        out = np.empty((len(roles_order) * d,), dtype=np.float32)
+    for r, role in enumerate(roles_order):
         if role == "predicate":
-            v = span_mean(token_vectors, frame.predicate)
+            s, e = frame.predicate
         else:
-            span = frame.roles.get(role, (0, 0))
-            v = span_mean(token_vectors, span)
-        parts.append(v.reshape(-1))
-    return np.concatenate(parts, axis=0).astype(np.float32)
+            s, e = frame.roles.get(role, (0, 0))
+        seg = out[r * d:(r + 1) * d]
+        if e <= s:
+            seg[:] = 0.0
+        else:
+            np.mean(token_vectors[s:e], axis=0, out=seg)
+    return out
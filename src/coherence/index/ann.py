@@ -1,23 +1,110 @@
 from __future__ import annotations
 
 from typing import Dict, List, Tuple
+import threading
 import numpy as np
 from pathlib import Path
 from coherence.cfg.loader import load_app_config
 
+
+class AnnPayloadStore:
+    """Columnar (SoA) store for span payloads aligned with ANN labels.
+
+    Vector fields are kept as (N, k) float32 columns and scalars as (N,)
+    columns so callers can filter candidates with a single array scan;
+    `get_payload(i)` rebuilds the record dict on demand. Only the fields
+    listed below are stored: any other key in an added payload is dropped.
+    """
+
+    VEC_FIELDS = ("alpha", "u", "r")
+    F32_FIELDS = ("U", "C", "t", "tau")
+    I32_FIELDS = ("start", "end")
+    STR_FIELDS = ("doc_id", "text")
+
+    def __init__(self, k: int, capacity: int = 64) -> None:
+        self.k = int(k)
+        self._n = 0
+        self._cap = max(1, int(capacity))
+        self._cols: Dict[str, np.ndarray] = {}
+        for name in self.VEC_FIELDS:
+            self._cols[name] = np.empty((self._cap, self.k), dtype=np.float32)
+        for name in self.F32_FIELDS:
+            self._cols[name] = np.empty((self._cap,), dtype=np.float32)
+        for name in self.I32_FIELDS:
+            self._cols[name] = np.empty((self._cap,), dtype=np.int32)
+        self._strs: Dict[str, List[str]] = {name: [] for name in self.STR_FIELDS}
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i: int) -> dict:
+        return self.get_payload(i)
+
+    def _reserve(self, n: int) -> None:
+        if n <= self._cap:
+            return
+        cap = self._cap
+        while cap < n:
+            cap *= 2
+        for name, col in self._cols.items():
+            grown = np.empty((cap,) + col.shape[1:], dtype=col.dtype)
+            grown[: self._n] = col[: self._n]
+            self._cols[name] = grown
+        self._cap = cap
+
+    def col(self, name: str) -> np.ndarray:
+        """Return the filled part of a numeric column as a view."""
+        return self._cols[name][: self._n]
+
+    def add(self, payloads: List[dict]) -> None:
+        m = len(payloads)
+        if m == 0:
+            return
+        self._reserve(self._n + m)
+        lo, hi = self._n, self._n + m
+        for name in self.VEC_FIELDS:
+            src = "u" if name == "r" else name
+            self._cols[name][lo:hi] = [p.get(name, p[src]) for p in payloads]
+        defaults = {"U": 0.0, "C": 0.0, "t": 1.0, "tau": 0.0}
+        for name in self.F32_FIELDS:
+            self._cols[name][lo:hi] = [p.get(name, defaults[name]) for p in payloads]
+        for name in self.I32_FIELDS:
+            self._cols[name][lo:hi] = [p[name] for p in payloads]
+        for name in self.STR_FIELDS:
+            self._strs[name].extend(str(p.get(name, "")) for p in payloads)
+        self._n = hi
+
+    def get_payload(self, i: int) -> dict:
+        if not 0 <= i < self._n:
+            raise IndexError(i)
+        out: dict = {name: self._strs[name][i] for name in self.STR_FIELDS}
+        for name in self.I32_FIELDS:
+            out[name] = int(self._cols[name][i])
+        for name in self.VEC_FIELDS:
+            out[name] = self._cols[name][i].tolist()
+        for name in self.F32_FIELDS:
+            out[name] = float(self._cols[name][i])
+        return out
+
+
 # In-memory registry
 _indices: Dict[str, object] = {}
-_payloads: Dict[str, List[dict]] = {}
+_payloads: Dict[str, AnnPayloadStore] = {}
 _dims: Dict[str, int] = {}
 _backends: Dict[str, str] = {}
+# Guards the numpy backend's matrix/payload swap; hnswlib locks internally
+_lock = threading.Lock()
 
 
 def has_index(axis_pack_id: str) -> bool:
     return axis_pack_id in _indices
 
 
-def get_payloads(axis_pack_id: str) -> List[dict]:
-    return _payloads.get(axis_pack_id, [])
+def get_payloads(axis_pack_id: str) -> AnnPayloadStore:
+    store = _payloads.get(axis_pack_id)
+    if store is None:  # an empty store is falsy (__len__), so test identity
+        store = AnnPayloadStore(_dims.get(axis_pack_id, 0))
+    return store
 
 
 def init_index(axis_pack_id: str, k: int, backend: str | None = None) -> None:
@@ -43,32 +130,34 @@ def init_index(axis_pack_id: str, k: int, backend: str | None = None) -> None:
     else:
         # numpy backend stores just a matrix and grows dynamically
         _indices[axis_pack_id] = np.empty((0, k), dtype=np.float32)
-    _payloads.setdefault(axis_pack_id, [])
+    _payloads.setdefault(axis_pack_id, AnnPayloadStore(k))
 
 
 def add(axis_pack_id: str, items: np.ndarray, ids: List[str], payloads: List[dict]) -> None:
     be = _backends.get(axis_pack_id, "numpy")
     if be == "hnsw":
         index = _indices[axis_pack_id]
-        index.add_items(items, np.arange(index.get_current_count(), index.get_current_count() + items.shape[0]))
+        index.add_items(np.ascontiguousarray(items, dtype=np.float32), np.arange(index.get_current_count(), index.get_current_count() + items.shape[0]))
+        _payloads[axis_pack_id].add(payloads)
     else:
-        mat = _indices[axis_pack_id]
-        _indices[axis_pack_id] = np.vstack([mat, items.astype(np.float32)])
-    _payloads[axis_pack_id].extend(payloads)
+        with _lock:
+            mat = _indices[axis_pack_id]
+            _indices[axis_pack_id] = np.vstack([mat, np.asarray(items, dtype=np.float32)])
+            _payloads[axis_pack_id].add(payloads)
 
 
 def query(axis_pack_id: str, vec: np.ndarray, top_k: int) -> Tuple[List[int], np.ndarray]:
     be = _backends.get(axis_pack_id, "numpy")
     if be == "hnsw":
         index = _indices[axis_pack_id]
-        labels, distances = index.knn_query(vec.astype(np.float32), k=top_k)
+        labels, distances = index.knn_query(np.ascontiguousarray(vec, dtype=np.float32), k=top_k)
         return labels[0].tolist(), distances[0]
     else:
         mat = _indices.get(axis_pack_id)
         if mat is None or mat.shape[0] == 0:
             return [], np.array([])
         # L2 distance
-        diff = mat - vec.astype(np.float32)[None, :]
+        diff = mat - np.asarray(vec, dtype=np.float32)[None, :]
         dists = np.sqrt((diff * diff).sum(axis=1))
         idx = np.argsort(dists)[:top_k]
         return idx.tolist(), dists[idx]
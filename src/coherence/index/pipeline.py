@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+import hashlib
+import os
+import threading
 import numpy as np
 
 from coherence.axis.pack import AxisPack
@@ -13,7 +18,6 @@ from coherence.index.store import write_spans, write_frames
 from coherence.frames.srl_lite import build_frames
 from coherence.cfg.loader import load_app_config
 
-
 def _tokenize(text: str, mode: str) -> List[str]:
     if mode == "simple_split":
         return text.split()
@@ -21,6 +25,145 @@ def _tokenize(text: str, mode: str) -> List[str]:
     return text.split()
 
 
+def _emb_cache_dir(index_cfg: Dict[str, Any]) -> Path:
+    """Embedding cache root: index.embedding_cache_dir, else <artifacts>/cache/embeddings."""
+    configured = index_cfg.get("embedding_cache_dir")
+    if configured:
+        return Path(configured)
+    return Path(os.getenv("COHERENCE_ARTIFACTS_DIR", "artifacts")) / "cache" / "embeddings"
+
+
+def _text_key(text: str, tokenizer: str, model_name: str, normalize_input: bool, dim: int) -> str:
+    """Stable cache key for a document's token embeddings under one encoder setup."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (model_name, str(bool(normalize_input)), str(int(dim)), tokenizer, text):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _cached_embedding(path: Path) -> np.ndarray:
+    """Memory-map a cached (n,d) float32 embedding; raises FileNotFoundError on miss."""
+    return np.load(path, mmap_mode="r")
+
+
+def _encode_tokens(enc: Any, cache_dir: Path, key: str, tokens: List[str]) -> np.ndarray:
+    """Encode tokens, reusing the on-disk embedding cache keyed by text hash."""
+    path = cache_dir / f"{key}.npy"
+    try:
+        return _cached_embedding(path)
+    except (FileNotFoundError, ValueError):
+        pass
+    X = np.asarray(enc.encode(tokens), dtype=np.float32)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.npy"
+    np.save(tmp, X)
+    os.replace(tmp, path)  # readers never see a partially written file
+    return X
+
+
+def _process_doc(
+    doc: Dict[str, str],
+    pack: AxisPack,
+    enc: Any,
+    *,
+    tokenizer: str,
+    span_window: int,
+    span_stride: int,
+    squash: bool,
+    cache_dir: Optional[Path],
+    model_name: str,
+    normalize_input: bool,
+    dim: int,
+) -> Optional[Tuple[List[dict], np.ndarray, List[str], List[dict]]]:
+    """Encode one document and build its span and frame records.
+
+    Pure per-document work (no shared state is written) so it can run on a
+    worker thread. Returns None for documents without tokens, otherwise
+    (span_records, u_batch, ann_ids, frame_records).
+    """
+    doc_id = doc["doc_id"]
+    text = doc["text"]
+    tokens = _tokenize(text, tokenizer)
+    if not tokens:
+        return None
+    if cache_dir is not None:
+        key = _text_key(text, tokenizer, model_name, normalize_input, dim)
+        X = _encode_tokens(enc, cache_dir, key, tokens)  # (n,d)
+    else:
+        X = np.asarray(enc.encode(tokens), dtype=np.float32)  # (n,d)
+    n, d = X.shape
+
+    # Sliding windows
+    span_records: List[dict] = []
+    ann_ids: List[str] = []
+    starts = range(0, n, span_stride)
+    u_batch = np.empty((len(starts), pack.k), dtype=np.float32)
+
+    for i, start in enumerate(starts):
+        end = min(start + span_window, n)
+        if end - start <= 0:
+            break
+        x = X[start:end].mean(axis=0)  # (d,)
+        alpha = project(x, pack)  # (k,)
+        u = utilities(alpha, pack)
+        if squash:
+            u = 1.0 / (1.0 + np.exp(-u))
+        U = float(aggregate(u, pack))
+        C = float(span_coherence(X, pack, start, end, max_skip=2))
+        rec = {
+            "doc_id": doc_id,
+            "start": start,
+            "end": end,
+            "text": " ".join(tokens[start:end]),
+            "alpha": np.asarray(alpha, dtype=np.float32).tolist(),
+            "u": np.asarray(u, dtype=np.float32).tolist(),
+            "r": np.asarray(u, dtype=np.float32).tolist(),  # TODO(@builder): gating
+            "U": U,
+            "C": C,
+            "t": 1.0,
+            "tau": 0.0,
+        }
+        span_records.append(rec)
+        u_batch[i] = u
+        ann_ids.append(f"{doc_id}:{start}-{end}")
+
+    # Frames indexing
+    frames = build_frames(X, pack, saliency_thresh=0.0, arg_band=0.5, max_arg_len=2)
+    frame_records: List[dict] = []
+    for fr in frames:
+        # Mean embedding over predicate + all role tokens
+        idxs: List[int] = list(range(fr.predicate[0], fr.predicate[1]))
+        for _, (s, e) in fr.roles.items():
+            idxs.extend(range(s, e))
+        idxs = [ix for ix in idxs if 0 <= ix < X.shape[0]]
+        if not idxs:
+            continue
+        x = X[idxs].mean(axis=0)
+        a = project(x, pack)
+        u = utilities(a, pack)
+        if squash:
+            u = 1.0 / (1.0 + np.exp(-u))
+        U = float(aggregate(u, pack))
+        rec_f = {
+            "doc_id": doc_id,
+            "frame_id": str(fr.id),
+            "pred_start": int(fr.predicate[0]),
+            "pred_end": int(fr.predicate[1]),
+            "roles": {k: [int(s), int(e)] for k, (s, e) in fr.roles.items()},
+            "alpha": np.asarray(a, dtype=np.float32).tolist(),
+            "u": np.asarray(u, dtype=np.float32).tolist(),
+            "r": np.asarray(u, dtype=np.float32).tolist(),
+            "U": U,
+            "t": 1.0,
+            "tau": 0.0,
+        }
+        frame_records.append(rec_f)
+
+    return span_records, u_batch[: len(span_records)], ann_ids, frame_records
+
+
 def run_index(axis_pack_id: str, docs: List[Dict[str, str]], options: Dict[str, Any]) -> Dict[str, Any]:
     cfg = load_app_config()
     index_cfg = cfg.get("index", {})
@@ -29,6 +172,8 @@ def run_index(axis_pack_id: str, docs: List[Dict[str, str]], options: Dict[str,
     span_window = int(index_cfg.get("span_window", 64))
     span_stride = int(index_cfg.get("span_stride", 32))
     squash = bool(search_cfg.get("squash", True))
+    cache_dir = _emb_cache_dir(index_cfg) if index_cfg.get("embedding_cache", True) else None
+    workers = int((options or {}).get("workers") or index_cfg.get("workers") or os.cpu_count() or 1)
 
     # Load pack
     pack_path = Path("data/axes") / f"{axis_pack_id}.json"
@@ -37,95 +182,47 @@ def run_index(axis_pack_id: str, docs: List[Dict[str, str]], options: Dict[str,
     pack = AxisPack.load(pack_path)
 
     enc = get_encoder()
+    model_name = str(getattr(enc, "model_name", ""))
+    normalize_input = bool(getattr(enc, "normalize_input", False))
+    dim = int(enc._model.get_sentence_embedding_dimension())
 
     # Init ANN on k-dim u vectors
     init_index(axis_pack_id, k=pack.k, backend=cfg.get("ann", {}).get("backend", "numpy"))
 
     indexed_ids: List[str] = []
 
-    for doc in docs:
-        doc_id = doc["doc_id"]
-        text = doc["text"]
-        tokens = _tokenize(text, tokenizer)
-        if not tokens:
-            continue
-        X = enc.encode(tokens).astype(np.float32)  # (n,d)
-        n, d = X.shape
-
-        # Sliding windows
-        span_records: List[dict] = []
-        ann_items: List[np.ndarray] = []
-        ann_ids: List[str] = []
-        ann_payloads: List[dict] = []
-
-        for start in range(0, n, span_stride):
-            end = min(start + span_window, n)
-            if end - start <= 0:
-                break
-            x = X[start:end].mean(axis=0)  # (d,)
-            alpha = project(x, pack)  # (k,)
-            u = utilities(alpha, pack)
-            if squash:
-                u = 1.0 / (1.0 + np.exp(-u))
-            U = float(aggregate(u, pack))
-            C = float(span_coherence(X, pack, start, end, max_skip=2))
-            rec = {
-                "doc_id": doc_id,
-                "start": start,
-                "end": end,
-                "text": " ".join(tokens[start:end]),
-                "alpha": alpha.astype(np.float32).tolist(),
-                "u": u.astype(np.float32).tolist(),
-                "r": u.astype(np.float32).tolist(),  # TODO(@builder): gating
-                "U": U,
-                "C": C,
-                "t": 1.0,
-                "tau": 0.0,
-            }
-            span_records.append(rec)
-            ann_items.append(u.astype(np.float32))
-            ann_ids.append(f"{doc_id}:{start}-{end}")
-            ann_payloads.append(rec)
-
-        # Persist and add to ANN
-        if span_records:
-            write_spans(axis_pack_id, doc_id, span_records)
-            ann_add(axis_pack_id, np.vstack(ann_items), ann_ids, ann_payloads)
-
-        # Frames indexing and persistence
-        frames = build_frames(X, pack, saliency_thresh=0.0, arg_band=0.5, max_arg_len=2)
-        frame_records: List[dict] = []
-        for fr in frames:
-            # Mean embedding over predicate + all role tokens
-            idxs: List[int] = list(range(fr.predicate[0], fr.predicate[1]))
-            for _, (s, e) in fr.roles.items():
-                idxs.extend(range(s, e))
-            idxs = [ix for ix in idxs if 0 <= ix < X.shape[0]]
-            if not idxs:
+    def work(doc: Dict[str, str]):
+        return _process_doc(
+            doc,
+            pack,
+            enc,
+            tokenizer=tokenizer,
+            span_window=span_window,
+            span_stride=span_stride,
+            squash=squash,
+            cache_dir=cache_dir,
+            model_name=model_name,
+            normalize_input=normalize_input,
+            dim=dim,
+        )
+
+    # Per-doc encoding/projection runs in parallel (numpy/BLAS and the encoder
+    # release the GIL); persistence and ANN inserts stay ordered on this thread.
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(docs) or 1))) as pool:
+        for doc, res in zip(docs, pool.map(work, docs), strict=True):
+            if res is None:
                 continue
-            x = X[idxs].mean(axis=0)
-            a = project(x, pack)
-            u = utilities(a, pack)
-            if squash:
-                u = 1.0 / (1.0 + np.exp(-u))
-            U = float(aggregate(u, pack))
-            rec_f = {
-                "doc_id": doc_id,
-                "frame_id": str(fr.id),
-                "pred_start": int(fr.predicate[0]),
-                "pred_end": int(fr.predicate[1]),
-                "roles": {k: [int(s), int(e)] for k, (s, e) in fr.roles.items()},
-                "alpha": a.astype(np.float32).tolist(),
-                "u": u.astype(np.float32).tolist(),
-                "r": u.astype(np.float32).tolist(),
-                "U": U,
-                "t": 1.0,
-                "tau": 0.0,
-            }
-            frame_records.append(rec_f)
-        if frame_records:
-            write_frames(axis_pack_id, doc_id, frame_records)
-
-        indexed_ids.append(doc_id)
+            doc_id = doc["doc_id"]
+            span_records, u_batch, ann_ids, frame_records = res
+
+            # Persist and add to ANN
+            if span_records:
+                write_spans(axis_pack_id, doc_id, span_records)
+                ann_add(axis_pack_id, u_batch, ann_ids, span_records)
+
+            if frame_records:
+                write_frames(axis_pack_id, doc_id, frame_records)
+
+            indexed_ids.append(doc_id)
 
     return {"indexed": indexed_ids, "anns_built": True, "tau_used": [0.0]}
@@ -16,6 +16,8 @@ class FrameStore:
       - frames(frame_id PK, doc_id, pack_id, pack_hash, k, d, predicate_start, predicate_end, roles_json, meta_json, created_at)
       - frame_axis(frame_id, axis_idx, coord) PRIMARY KEY(frame_id, axis_idx)
       - frame_vectors(frame_id PK, vec BLOB)
+      - frames_fts(frame_id, meta_text) FTS5 trigram index over frames.meta_json,
+        kept in sync by triggers (skipped if SQLite lacks FTS5)
     """
 
     def __init__(self, db_path: Path) -> None:
@@ -84,6 +86,42 @@ class FrameStore:
         cur.execute("CREATE INDEX IF NOT EXISTS ix_axis_idx_coord ON frame_axis(axis_idx, coord);")
         self.conn.commit()
 
+        # 4) Full-text index over meta_json for trace(); rowids mirror frames.rowid
+        self.has_fts = self._ensure_fts(cur)
+        self.conn.commit()
+
+    @staticmethod
+    def _ensure_fts(cur: sqlite3.Cursor) -> bool:
+        cur.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='frames_fts'")
+        existed = cur.fetchone() is not None
+        try:
+            cur.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS frames_fts "
+                "USING fts5(frame_id UNINDEXED, meta_text, tokenize='trigram')"
+            )
+        except sqlite3.OperationalError:
+            # FTS5/trigram unavailable in this SQLite build; trace() falls back to LIKE
+            return False
+        cur.executescript(
+            """
+            CREATE TRIGGER IF NOT EXISTS frames_fts_ai AFTER INSERT ON frames BEGIN
+              INSERT INTO frames_fts(rowid, frame_id, meta_text) VALUES (new.rowid, new.frame_id, new.meta_json);
+            END;
+            CREATE TRIGGER IF NOT EXISTS frames_fts_ad AFTER DELETE ON frames BEGIN
+              DELETE FROM frames_fts WHERE rowid = old.rowid;
+            END;
+            CREATE TRIGGER IF NOT EXISTS frames_fts_au AFTER UPDATE OF meta_json ON frames BEGIN
+              DELETE FROM frames_fts WHERE rowid = old.rowid;
+              INSERT INTO frames_fts(rowid, frame_id, meta_text) VALUES (new.rowid, new.frame_id, new.meta_json);
+            END;
+            """
+        )
+        if not existed:
+            cur.execute(
+                "INSERT INTO frames_fts(rowid, frame_id, meta_text) SELECT rowid, frame_id, meta_json FROM frames"
+            )
+        return True
+
     @staticmethod
     def _to_blob(vec: Iterable[float]) -> bytes:
         arr = np.asarray(list(vec), dtype=np.float32)
@@ -210,33 +248,51 @@ class FrameStore:
         return items
 
     def trace(self, *, entity_str: str, limit: int) -> List[Dict[str, Any]]:
-        # MVP: search meta_json text for case-insensitive match
+        """Frames whose meta_json contains entity_str (case-insensitive), first `limit` matches.
+
+        The predicate runs inside SQLite: an FTS5 trigram MATCH when available
+        (terms of 3+ chars), otherwise an escaped LIKE scan.
+        """
         term = entity_str.lower()
         cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT frame_id, doc_id, pack_id, pack_hash, k, d, predicate_start, predicate_end, meta_json
-            FROM frames
-            LIMIT ?
-            """,
-            (int(limit),),
-        )
+        cols = "f.frame_id, f.doc_id, f.pack_id, f.pack_hash, f.k, f.d, f.predicate_start, f.predicate_end"
+        if self.has_fts and len(term) >= 3:
+            cur.execute(
+                f"""
+                SELECT {cols}
+                FROM frames_fts JOIN frames f ON f.rowid = frames_fts.rowid
+                WHERE frames_fts MATCH ?
+                ORDER BY f.rowid
+                LIMIT ?
+                """,
+                ('"' + term.replace('"', '""') + '"', int(limit)),
+            )
+        else:
+            pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            cur.execute(
+                f"""
+                SELECT {cols}
+                FROM frames f
+                WHERE LOWER(f.meta_json) LIKE ? ESCAPE '\\'
+                ORDER BY f.rowid
+                LIMIT ?
+                """,
+                (pattern, int(limit)),
+            )
         rows = cur.fetchall()
         items: List[Dict[str, Any]] = []
         for r in rows:
-            meta_text = r[8] or ""
-            if term in meta_text.lower():
-                items.append(
-                    {
-                        "frame_id": r[0],
-                        "doc_id": r[1],
-                        "pack_id": r[2],
-                        "pack_hash": r[3],
-                        "k": r[4],
-                        "d": r[5],
-                        "predicate": [r[6], r[7]],
-                    }
-                )
+            items.append(
+                {
+                    "frame_id": r[0],
+                    "doc_id": r[1],
+                    "pack_id": r[2],
+                    "pack_hash": r[3],
+                    "k": r[4],
+                    "d": r[5],
+                    "predicate": [r[6], r[7]],
+                }
+            )
         return items
 
 
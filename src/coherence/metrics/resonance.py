@@ -13,7 +13,7 @@ from typing import Optional, Sequence
 import numpy as np
 
 from coherence.axis.pack import AxisPack
-from coherence.axis.choquet import choquet_integral
+from coherence.axis.choquet import choquet_integral, choquet_integral_batch
 
 
 def project(X: np.ndarray, pack: AxisPack) -> np.ndarray:
@@ -39,8 +39,8 @@ def utilities(coords: np.ndarray, pack: AxisPack) -> np.ndarray:
 
     Shapes preserved: (k,) -> (k,), (n,k) -> (n,k)
     """
-    lam = pack.lambda_.astype(np.float32)
-    beta = pack.beta.astype(np.float32)
+    lam = np.asarray(pack.lambda_, dtype=np.float32)
+    beta = np.asarray(pack.beta, dtype=np.float32)
     if coords.ndim == 1:
         return lam * coords + beta
     elif coords.ndim == 2:
@@ -49,17 +49,36 @@ def utilities(coords: np.ndarray, pack: AxisPack) -> np.ndarray:
         raise ValueError("coords must be 1D or 2D array")
 
 
+def axis_utilities(X: np.ndarray, pack: AxisPack) -> np.ndarray:
+    """Fused ``utilities(project(X))`` for a (n, d) batch.
+
+    The affine step runs in place on the projection, so the (n, k) result is
+    the only array allocated. Values match the unfused path exactly.
+    """
+    if X.ndim != 2:
+        raise ValueError("X must be 2D array")
+    U = np.asarray(X @ pack.Q, dtype=np.float32)
+    np.multiply(U, np.asarray(pack.lambda_, dtype=np.float32), out=U)
+    np.add(U, np.asarray(pack.beta, dtype=np.float32), out=U)
+    return U
+
+
 def aggregate(u: np.ndarray, pack: AxisPack) -> np.ndarray:
     """Aggregate per-axis utilities to a scalar per sample.
 
     If pack.mu is non-empty, use discrete Choquet integral.
     Otherwise use linear weights dot-product.
     """
+    table = pack.mu_table if pack.mu else None
     if u.ndim == 1:
+        if table is not None:
+            return np.array(choquet_integral_batch(u.reshape(1, -1), table)[0], dtype=np.float32)
         if pack.mu:
             return np.array(choquet_integral(u.tolist(), pack.mu), dtype=np.float32)
         return np.array(np.dot(u, pack.weights), dtype=np.float32)
     elif u.ndim == 2:
+        if table is not None:
+            return np.asarray(choquet_integral_batch(u, table), dtype=np.float32)
         out = []
         if pack.mu:
             for row in u:
@@ -75,6 +94,8 @@ def resonance(X: np.ndarray, pack: AxisPack) -> np.ndarray:
 
     Returns a scalar for 1D input or a (n,) array for 2D.
     """
+    if X.ndim == 2:
+        return aggregate(axis_utilities(X, pack), pack)
     coords = project(X, pack)
     u = utilities(coords, pack)
     return aggregate(u, pack)
@@ -67,19 +67,10 @@ def compute_frame_vectors(token_vectors: np.ndarray, frames: Sequence[Frame]) ->
     d = X.shape[1]
     if not frames:
         return np.zeros((0, 3 * d), dtype=np.float32)
-    embs = [frame_embedding(X, fr) for fr in frames]
-    return np.stack(embs, axis=0).astype(np.float32)
-
-
-def _role_mean(token_vectors: np.ndarray, frame: Frame, role: str) -> np.ndarray:
-    X = np.asarray(token_vectors, dtype=np.float32)
-    if role == "predicate":
-        s, e = frame.predicate
-    else:
-        s, e = frame.roles.get(role, (0, 0))
-    if e <= s:
-        return np.zeros((X.shape[1],), dtype=np.float32)
-    return np.asarray(X[s:e].mean(axis=0), dtype=np.float32)
+    out = np.empty((len(frames), 3 * d), dtype=np.float32)
+    for i, fr in enumerate(frames):
+        frame_embedding(X, fr, out=out[i])
+    return out
 
 
 def project_frame_roles(
@@ -93,12 +84,17 @@ def project_frame_roles(
     Returns mapping: frame_id -> { role -> coords (k,) }
     """
     out: Dict[str, Dict[str, np.ndarray]] = {}
-    for fr in frames:
-        role_map: Dict[str, np.ndarray] = {}
-        for role in roles:
-            v = _role_mean(token_vectors, fr, role)
-            role_map[role] = project(v, pack)
-        out[fr.id] = role_map
+    if not frames:
+        return out
+    X = np.asarray(token_vectors, dtype=np.float32)
+    d = X.shape[1]
+    # Role means for all frames in one (m, R*d) buffer, projected in one matmul
+    means = np.empty((len(frames), len(roles) * d), dtype=np.float32)
+    for i, fr in enumerate(frames):
+        frame_embedding(X, fr, roles_order=roles, out=means[i])
+    coords = project(means.reshape(-1, d), pack).reshape(len(frames), len(roles), -1)
+    for i, fr in enumerate(frames):
+        out[fr.id] = {role: coords[i, r] for r, role in enumerate(roles)}
     return out
 
 
@@ -110,4 +106,4 @@ def aggregate_frame_coords(role_coords: Dict[str, np.ndarray], mode: str = "mean
     if not role_coords:
         return np.zeros((0,), dtype=np.float32)
     stacked = np.stack([v for v in role_coords.values()], axis=0)
-    return stacked.mean(axis=0).astype(np.float32)
+    return np.asarray(stacked.mean(axis=0), dtype=np.float32)
@@ -1,25 +1,35 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Optional
-import numpy as np, json, pathlib, os
-from ..types import AxisPack, Axis
+import numpy as np, pathlib, os
+from ..types import AxisPack
 from ..axes.build import build_axis_pack
 from ..axes.calibrate import pick_thresholds
-from ..encoders import get_encoder
+from ..axes.store import save_pack, load_pack
+from ..encoders import get_encoder, encode_many
 
 router = APIRouter(prefix="/v1/axes", tags=["axes"])
 ART_DIR = pathlib.Path(os.getenv("COHERENCE_ARTIFACTS_DIR", "artifacts")); ART_DIR.mkdir(exist_ok=True)
 ACTIVE: Dict[str, Optional[AxisPack]] = {"pack": None}
+# On-disk axis matrix precision: float32 (default), float16, or int8 + per-axis scale
+# for large packs; smaller files for a small rounding error, widened once on activate
+AXES_STORAGE = os.getenv("COHERENCE_AXES_STORAGE", "float32").lower()
 
-def _npz_path(pack_id: str) -> pathlib.Path:
-    colon = ART_DIR / f"axis_pack:{pack_id}.npz"
-    safe = ART_DIR / f"axis_pack_{pack_id}.npz"
-    return colon if colon.exists() else safe
-
-def _meta_path(pack_id: str) -> pathlib.Path:
-    colon = ART_DIR / f"axis_pack:{pack_id}.meta.json"
-    safe = ART_DIR / f"axis_pack_{pack_id}.meta.json"
-    return colon if colon.exists() else safe
+def _phrase_seed_vectors(enc, seed_phrases: List[List[str]]) -> np.ndarray:
+    """Mean of token-mean-pooled phrase embeddings per axis -> [n_axes, D] float32.
+    All phrases are encoded together; each is accumulated straight into its axis row."""
+    counts = np.array([len(ps) for ps in seed_phrases], dtype=np.float32)
+    owner = np.repeat(np.arange(len(seed_phrases)), counts.astype(np.intp))
+    out: Optional[np.ndarray] = None
+    for r, X in zip(owner, encode_many([p for ps in seed_phrases for p in ps], enc)):
+        X = X.reshape(-1, X.shape[-1])
+        if out is None:
+            out = np.zeros((len(seed_phrases), X.shape[1]), dtype=np.float32)
+            buf = np.empty(X.shape[1], dtype=np.float32)
+        np.mean(X, axis=0, out=buf)
+        out[r] += buf
+    out /= counts[:, None]
+    return out
 
 class BuildRequest(BaseModel):
     names: List[str]
@@ -40,17 +50,9 @@ def build(req: BuildRequest):
     if req.seed_vectors:
         vecs = [np.array(v, dtype=np.float32) for v in req.seed_vectors]
     elif req.seed_phrases:
-        vecs = []
-        for phrases in req.seed_phrases:
-            if not phrases:
-                raise HTTPException(400, "seed_phrases entries must be non-empty")
-            # mean pool over phrases → each phrase mean-pooled over tokens
-            phrase_vecs = []
-            for p in phrases:
-                X = enc.encode_text(p)  # [T,D]
-                phrase_vecs.append(X.mean(axis=0))
-            v = np.stack(phrase_vecs, axis=0).mean(axis=0)
-            vecs.append(v.astype(np.float32))
+        if not all(req.seed_phrases):
+            raise HTTPException(400, "seed_phrases entries must be non-empty")
+        vecs = list(_phrase_seed_vectors(enc, req.seed_phrases))
     else:
         raise HTTPException(400, "Provide seed_phrases or seed_vectors")
 
@@ -63,36 +65,16 @@ def build(req: BuildRequest):
 
     ACTIVE["pack"] = pack
 
-    # Persist
-    np.savez_compressed(ART_DIR / f"axis_pack_{pack.id}.npz", **{a.name:a.vector for a in pack.axes})
-    (ART_DIR / f"axis_pack_{pack.id}.meta.json").write_text(json.dumps({
-        "meta": pack.meta,
-        "names": [a.name for a in pack.axes],
-        "dim": pack.dim,
-        "thresholds": {a.name:a.threshold for a in pack.axes}
-    }, indent=2))
+    save_pack(pack, ART_DIR, storage=AXES_STORAGE)
 
     return {"pack_id": pack.id, "axes":[a.name for a in pack.axes], "dim": pack.dim}
 
 @router.post("/activate")
 def activate(pack_id: str):
-    meta_path = _meta_path(pack_id)
-    npz_path  = _npz_path(pack_id)
-    if not (meta_path.exists() and npz_path.exists()):
-        raise HTTPException(404, "Axis pack not found")
-    arrs = np.load(npz_path)
-    meta = json.loads(meta_path.read_text())
-    thresholds = meta.get("thresholds", {})
-    axes = [
-        Axis(name=k, vector=arrs[k], threshold=float(thresholds.get(k, 0.0)), provenance=meta.get("meta", {}))
-        for k in arrs.files
-    ]
-    ACTIVE["pack"] = AxisPack(
-        id=pack_id,
-        axes=axes,
-        dim=axes[0].vector.shape[0],
-        meta=meta.get("meta",{})
-    )
+    try:
+        ACTIVE["pack"] = load_pack(pack_id, ART_DIR)
+    except FileNotFoundError:
+        raise HTTPException(404, "Axis pack not found") from None
     return {"ok": True}
 
 @router.post("/{pack_id}/activate")
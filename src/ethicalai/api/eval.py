@@ -1,11 +1,9 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Optional
-import numpy as np
 from ..types import DecisionProof, AxisPack
-from ..eval.spans import project_scores
-from ..eval.minspan import minimal_veto_spans
-from ..encoders import get_encoder, align_dim
+from ..eval.spans import project_span_array, span_dicts, veto_rows
+from ..encoders import get_encoder, align_tokens, encode_text_cached
 from .axes import ACTIVE
 
 router = APIRouter(prefix="/v1/eval", tags=["eval"])
@@ -25,15 +23,10 @@ def eval_text(req: EvalRequest):
     pack: Optional[AxisPack] = ACTIVE["pack"]
     if not pack or not getattr(pack, "axes", None):
         raise HTTPException(409, "No active axis pack. Build or activate one via /v1/axes/*")
-    enc = get_encoder()
-    X = enc.encode_text(req.text)  # [T,D] or [D]
-    # Align dimensionality to pack
-    if getattr(X, "ndim", 2) == 1:
-        X = align_dim(X, pack.dim)[None, :]
-    elif X.shape[1] != pack.dim:
-        X = np.stack([align_dim(t, pack.dim) for t in X], axis=0)
-    spans = project_scores(X, pack, req.window, req.stride)
-    veto = minimal_veto_spans(spans)
+    # [T,D] or [D] -> [T, pack.dim] float32
+    X = align_tokens(encode_text_cached(req.text, get_encoder()), pack.dim)
+    spans = project_span_array(X, pack, req.window, req.stride)
+    veto = span_dicts(spans[veto_rows(spans, pack)], pack)  # only the veto spans become dicts
     proof: DecisionProof = {
         "objective":"Maximize human autonomy based on objective empirical truth",
         "pack_id": pack.id,
@@ -2,58 +2,46 @@ from __future__ import annotations
 import argparse, json, pathlib, os
 import numpy as np
 from typing import Dict, List, Tuple, Iterable
-from ..types import AxisPack, Axis
-from ..encoders import get_encoder, align_dim
+from ..types import AxisPack
+from .store import load_pack, read_meta, write_meta
+from ..encoders import get_encoder, align_dim, encode_many
 
 def pick_thresholds(pack: AxisPack, scores: Dict[str, List[Tuple[float,int]]], fpr_max: float=0.05) -> AxisPack:
-    """scores[axis] = [(score, label{0/1}), ...] ; set ax.threshold via simple ROC sweep."""
+    """scores[axis] = [(score, label{0/1}), ...] ; set ax.threshold via simple ROC sweep.
+
+    Vectorized sweep: sort once, then confusion counts for every candidate tau
+    come from cumulative label counts (points with s > tau lie after the last
+    tie of tau in sorted order).
+    """
     for ax in pack.axes:
-        pts = sorted(scores.get(ax.name, []))
+        pts = scores.get(ax.name, [])
         if not pts:
             ax.threshold = 0.0
             continue
-        # candidate taus are observed scores
-        best_tau, best_f1 = 0.0, -1.0
-        for tau in [p[0] for p in pts]:
-            tp = sum(1 for s,l in pts if s>tau and l==1)
-            fp = sum(1 for s,l in pts if s>tau and l==0)
-            fn = sum(1 for s,l in pts if s<=tau and l==1)
-            tn = sum(1 for s,l in pts if s<=tau and l==0)
-            fpr = fp / max(fp+tn,1)
-            if fpr <= fpr_max:
-                prec = tp / max(tp+fp,1)
-                rec  = tp / max(tp+fn,1)
-                f1   = 2*prec*rec / max(prec+rec,1e-12)
-                if f1 > best_f1:
-                    best_f1, best_tau = f1, tau
-        ax.threshold = float(best_tau)
+        arr = np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+        order = np.argsort(arr[:, 0], kind="stable")
+        s, lab = arr[order, 0], arr[order, 1].astype(np.int64)
+        pos, neg = (lab == 1).astype(np.int64), (lab == 0).astype(np.int64)
+        P, N = int(pos.sum()), int(neg.sum())
+        # candidate taus are observed scores; counts at the last index of each tie group
+        last = np.searchsorted(s, s, side="right") - 1
+        fn = np.cumsum(pos)[last]
+        tn = np.cumsum(neg)[last]
+        tp, fp = P - fn, N - tn
+        fpr = fp / np.maximum(fp + tn, 1)
+        prec = tp / np.maximum(tp + fp, 1)
+        rec = tp / np.maximum(tp + fn, 1)
+        f1 = 2 * prec * rec / np.maximum(prec + rec, 1e-12)
+        valid = fpr <= fpr_max
+        # first tau with the best F1 among FPR-feasible ones (matches strict '>' scan)
+        ax.threshold = float(s[np.argmax(np.where(valid, f1, -1.0))]) if valid.any() else 0.0
     return pack
 
 # -------------------- CLI & utilities --------------------
 
 def _load_pack_from_artifacts(pack_id: str, artifacts_dir: str = "artifacts") -> AxisPack:
     art = pathlib.Path(os.getenv("COHERENCE_ARTIFACTS_DIR", artifacts_dir))
-    # Resolve paths with backward compatibility: prefer legacy colon names if present
-    colon_npz = art / f"axis_pack:{pack_id}.npz"
-    safe_npz = art / f"axis_pack_{pack_id}.npz"
-    npz_path = colon_npz if colon_npz.exists() else safe_npz
-
-    colon_meta = art / f"axis_pack:{pack_id}.meta.json"
-    safe_meta = art / f"axis_pack_{pack_id}.meta.json"
-    meta_path = colon_meta if colon_meta.exists() else safe_meta
-
-    if not npz_path.exists() or not meta_path.exists():
-        raise FileNotFoundError(f"Pack {pack_id} not found in {art}")
-    arrs = np.load(npz_path)
-    meta = json.loads(meta_path.read_text())
-    axes: List[Axis] = []
-    thresholds = meta.get("thresholds", {})
-    for name in arrs.files:
-        vec = arrs[name]
-        tau = float(thresholds.get(name, 0.0))
-        axes.append(Axis(name=name, vector=vec, threshold=tau, provenance=meta.get("meta", {})))
-    dim = axes[0].vector.shape[0] if axes else 0
-    return AxisPack(id=pack_id, axes=axes, dim=dim, meta=meta.get("meta", {}))
+    return load_pack(pack_id, art)
 
 def _save_thresholds(pack: AxisPack, artifacts_dir: str = "artifacts") -> None:
     art = pathlib.Path(os.getenv("COHERENCE_ARTIFACTS_DIR", artifacts_dir))
@@ -61,8 +49,10 @@ def _save_thresholds(pack: AxisPack, artifacts_dir: str = "artifacts") -> None:
     safe = art / f"axis_pack_{pack.id}.meta.json"
     # If legacy colon meta exists, update it; otherwise write Windows-safe underscore meta
     meta_path = colon if colon.exists() else safe
-    meta = {"meta": pack.meta, "thresholds": {ax.name: ax.threshold for ax in pack.axes}}
-    meta_path.write_text(json.dumps(meta, indent=2))
+    # merge so names/dim written by save_pack survive (the .matrix.npy loader needs names)
+    meta = read_meta(meta_path) if meta_path.exists() else {}
+    meta.update({"meta": pack.meta, "thresholds": {ax.name: ax.threshold for ax in pack.axes}})
+    write_meta(meta_path, meta)
 
 def _iter_jsonl(path: pathlib.Path) -> Iterable[Dict]:
     for line in path.read_text().splitlines():
@@ -71,59 +61,57 @@ def _iter_jsonl(path: pathlib.Path) -> Iterable[Dict]:
             continue
         yield json.loads(line)
 
-def _score_text_per_axis(text: str, pack: AxisPack, encoder) -> Dict[str, float]:
-    """
-    Embed text -> token embeddings [T,D?]; mean-pool -> [D?]; align to pack.dim; project onto each axis.
-    """
-    X = encoder.encode_text(text)  # [T,D] or [D]
+def _pooled(X: np.ndarray, dim: int) -> np.ndarray:
+    """Token embeddings [T,D?] (or [D?]) -> mean-pooled [dim]."""
     v = X if X.ndim == 1 else X.mean(axis=0)
-    v = align_dim(v, pack.dim)
-    out = {}
-    for ax in pack.axes:
-        out[ax.name] = float(v @ align_dim(ax.vector, pack.dim))
-    return out
+    return align_dim(v, dim)
 
-def _collect_scores(datasets: List[str], pack: AxisPack, encoder) -> Dict[str, List[Tuple[float,int]]]:
+def _collect_scores(datasets: List[str], pack: AxisPack, encoder,
+                    batch_size: int = 64) -> Dict[str, List[Tuple[float,int]]]:
+    """Score every example on every axis: pooled vectors are batched and projected with one GEMM."""
     scores: Dict[str, List[Tuple[float,int]]] = {ax.name: [] for ax in pack.axes}
+    A = pack.matrix  # [n_axes, dim] float32, stacked at build/activate time
+
+    def flush(texts: List[str], labels: List[int]) -> None:
+        V = np.stack([_pooled(X, pack.dim) for X in encode_many(texts, encoder)], axis=0)  # [B, dim]
+        S = V @ A.T  # [B, n_axes]
+        for j, ax in enumerate(pack.axes):
+            scores[ax.name].extend(zip(S[:, j].tolist(), labels))
+
+    texts: List[str] = []
+    labels: List[int] = []
     for d in datasets:
-        p = pathlib.Path(d)
-        for ex in _iter_jsonl(p):
-            text = ex["text"]
-            label = int(ex["label"])
-            s = _score_text_per_axis(text, pack, encoder)
-            for ax in pack.axes:
-                scores[ax.name].append((s[ax.name], label))
+        for ex in _iter_jsonl(pathlib.Path(d)):
+            texts.append(ex["text"])
+            labels.append(int(ex["label"]))
+            if len(texts) >= batch_size:
+                flush(texts, labels)
+                texts, labels = [], []
+    if texts:
+        flush(texts, labels)
     return scores
 
 def _metrics(points: List[Tuple[float,int]]):
     # Simple AUROC/AUPRC estimate via threshold sweep
     if not points:
         return {"auroc": 0.0, "auprc": 0.0}
-    pts = sorted(points, key=lambda x: x[0])
-    P = sum(l for _,l in pts)
-    N = len(pts) - P
+    arr = np.asarray(points, dtype=np.float64)
+    order = np.argsort(arr[:, 0], kind="stable")  # same tie order as sorted()
+    labels = arr[order, 1] == 1
+    P = int(labels.sum())
+    N = len(labels) - P
     if P == 0 or N == 0:
         return {"auroc": 1.0, "auprc": 1.0}
-    # ROC/AUC (rank-sum)
-    # Convert to ranks:
+    # ROC/AUC (rank-sum) with 1-based ranks:
     # AUC = (sum of ranks of positives - P(P+1)/2) / (P*N)
-    # Use 1-based ranks
-    rank_sum = 0
-    for idx, (_, label) in enumerate(pts, start=1):
-        if label == 1:
-            rank_sum += idx
+    rank_sum = float(np.flatnonzero(labels).sum() + P)
     auroc = (rank_sum - P*(P+1)/2) / (P*N)
-    # PR curve via sweep
-    auprc = 0.0
-    tp=fp=0
-    last_recall = 0.0
-    for score,label in reversed(pts):  # high->low threshold
-        if label==1: tp +=1
-        else: fp+=1
-        prec = tp / max(tp+fp,1)
-        rec  = tp / max(P,1)
-        auprc += prec * max(rec - last_recall, 0)
-        last_recall = rec
+    # PR curve via sweep high->low threshold: cumulative tp over the reversed order,
+    # one point per example, recall steps weighted by precision at that point
+    tp = np.cumsum(labels[::-1])
+    prec = tp / np.arange(1, len(tp) + 1)
+    rec = tp / P
+    auprc = float(np.dot(prec, np.diff(rec, prepend=0.0)))
     return {"auroc": float(auroc), "auprc": float(auprc)}
 
 def _sanitize_for_fs(name: str) -> str:
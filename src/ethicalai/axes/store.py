@@ -0,0 +1,76 @@
+from __future__ import annotations
+import pathlib
+import numpy as np
+from typing import Dict, List, Tuple
+import orjson
+from ..types import AxisPack, Axis
+
+# On-disk pack: axis_pack_<id>.matrix.npy ([n_axes, dim] float32, mmap'd on load)
+# plus axis_pack_<id>.meta.json (names, dim, thresholds, meta). Packs written as a
+# per-axis axis_pack_<id>.npz by older builds still load.
+# The matrix may instead be stored float16, or int8 with a per-axis scale (meta
+# "int8_scale"). Either is widened once on load: NumPy has no fp16/int8 GEMM, so
+# projection stays on the float32 SGEMM path and reduced precision only saves bytes.
+STORAGE_DTYPES = ("float32", "float16", "int8")
+INT8_MIN_SIZE = 1 << 16  # n_axes * dim below which int8 storage isn't worth the error
+
+def _path(art: pathlib.Path, pack_id: str, suffix: str) -> pathlib.Path:
+    # prefer legacy colon names if present
+    colon = art / f"axis_pack:{pack_id}{suffix}"
+    return colon if colon.exists() else art / f"axis_pack_{pack_id}{suffix}"
+
+def read_meta(path: pathlib.Path) -> Dict:
+    return orjson.loads(path.read_bytes())
+
+def write_meta(path: pathlib.Path, meta: Dict) -> None:
+    path.write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+
+def quantize_int8(M: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8: M ~= Q * scale[:, None]."""
+    amax = np.abs(M).max(axis=1) if M.size else np.zeros(M.shape[0], dtype=np.float32)
+    scale = np.where(amax > 0, amax / 127.0, 1.0).astype(np.float32)
+    Q = np.clip(np.rint(M / scale[:, None]), -127, 127).astype(np.int8)
+    return Q, scale
+
+def save_pack(pack: AxisPack, art: pathlib.Path, storage: str = "float32") -> None:
+    meta = {
+        "meta": pack.meta,
+        "names": pack.names,
+        "dim": pack.dim,
+        "thresholds": {a.name:a.threshold for a in pack.axes}
+    }
+    if storage not in STORAGE_DTYPES:
+        raise ValueError(f"storage must be one of {STORAGE_DTYPES}, got {storage!r}")
+    M = np.ascontiguousarray(pack.matrix, dtype=np.float32)
+    if storage == "int8" and M.size >= INT8_MIN_SIZE:
+        M, scale = quantize_int8(M)
+        meta["int8_scale"] = scale.tolist()
+    elif storage == "float16":
+        M = M.astype(np.float16)
+    np.save(art / f"axis_pack_{pack.id}.matrix.npy", M)
+    write_meta(art / f"axis_pack_{pack.id}.meta.json", meta)
+
+def load_pack(pack_id: str, art: pathlib.Path) -> AxisPack:
+    meta_path = _path(art, pack_id, ".meta.json")
+    mat_path = _path(art, pack_id, ".matrix.npy")
+    npz_path = _path(art, pack_id, ".npz")
+    if not meta_path.exists() or not (mat_path.exists() or npz_path.exists()):
+        raise FileNotFoundError(f"Pack {pack_id} not found in {art}")
+    meta = read_meta(meta_path)
+    thresholds = meta.get("thresholds", {})
+    provenance = meta.get("meta", {})
+    if mat_path.exists():
+        M = np.load(mat_path, mmap_mode="r")
+        if M.dtype == np.int8:
+            M = M * np.asarray(meta["int8_scale"], dtype=np.float32)[:, None]
+        elif M.dtype == np.float16:
+            M = M.astype(np.float32)
+        names: List[str] = list(meta["names"])
+        axes = [Axis(name=k, vector=M[r], threshold=float(thresholds.get(k, 0.0)), provenance=provenance)
+                for r, k in enumerate(names)]
+        return AxisPack(id=pack_id, axes=axes, dim=int(M.shape[1]), meta=provenance, matrix=M)
+    with np.load(npz_path) as arrs:  # NpzFile holds the zip open until closed
+        axes = [Axis(name=k, vector=arrs[k], threshold=float(thresholds.get(k, 0.0)), provenance=provenance)
+                for k in arrs.files]
+    dim = axes[0].vector.shape[0] if axes else 0
+    return AxisPack(id=pack_id, axes=axes, dim=dim, meta=provenance)
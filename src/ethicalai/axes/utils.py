@@ -2,12 +2,17 @@ import numpy as np
 from typing import List
 
 def gram_schmidt(vecs: List[np.ndarray]) -> List[np.ndarray]:
-    basis: List[np.ndarray] = []
+    if not vecs:
+        return []
+    B = np.zeros((len(vecs), np.asarray(vecs[0]).shape[0]), dtype=np.float64)  # accepted basis rows
+    k = 0
     for v in vecs:
-        w = v.astype(np.float64).copy()
-        for b in basis:
-            w -= (w @ b) * b
-        n = np.linalg.norm(w)
+        w = np.array(v, dtype=np.float64)
+        if k:
+            Bk = B[:k]
+            w -= Bk.T @ (Bk @ w)
+        n = float(np.sqrt(np.vdot(w, w)))
         if n > 1e-12:
-            basis.append((w / n).astype(np.float32))
-    return basis
+            B[k] = w / n
+            k += 1
+    return list(B[:k].astype(np.float32))
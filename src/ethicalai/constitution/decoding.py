@@ -2,59 +2,94 @@ from __future__ import annotations
 from typing import List, Dict, Optional, Tuple
 import numpy as np
 from ..types import AxisPack, DecisionProof
-from ..eval.spans import project_scores
-from ..eval.minspan import minimal_veto_spans
-from ..encoders import get_encoder, align_dim
+from ..eval.spans import window_bounds, window_means, pack_token_scores, span_array, span_dicts, veto_rows
+from ..encoders import get_encoder, align_tokens, encode_many
 
 def _axis_composite(spans: List[Dict], axes: Tuple[str, str]) -> float:
-    """Average window scores for the named axes. If axis missing, treat as 0."""
-    collected = {a: [] for a in axes}
+    """Average window scores for the named axes. If axis missing, treat as 0.
+    For serialized span lists; scoring uses _matrix_composite on the score matrix."""
+    sums = {a: 0.0 for a in axes}
+    counts = {a: 0 for a in axes}
     for s in spans:
-        if s["axis"] in collected:
-            collected[s["axis"]].append(float(s["score"]))
-    vals = [(np.mean(collected[a]) if collected[a] else 0.0) for a in axes]
+        a = s["axis"]
+        if a in sums:
+            sums[a] += float(s["score"])
+            counts[a] += 1
+    vals = [(sums[a] / counts[a] if counts[a] else 0.0) for a in axes]
     return float(np.mean(vals)) if vals else 0.0
 
-def _encode_tokens(text: str, dim: int, enc=None) -> np.ndarray:
-    enc = enc or get_encoder()
-    X = enc.encode_text(text)  # [T,D] or [D]
-    if X.ndim == 1:
-        return align_dim(X, dim)[None, :]
-    if X.shape[1] != dim:
-        X = np.stack([align_dim(t, dim) for t in X], axis=0)
-    return X.astype(np.float32)
-
-def _score_candidate(text: str, logprob: float, pack: AxisPack, enc=None,
-                     window: int = 32, stride: int = 16,
-                     pref_axes: Tuple[str, str] = ("autonomy", "truthfulness")):
-    X = _encode_tokens(text, pack.dim, enc=enc)
-    spans = project_scores(X, pack, window, stride)
-    veto = minimal_veto_spans(spans)
-    composite = _axis_composite(spans, pref_axes)
+def _matrix_composite(S: np.ndarray, pref_idx: List[Optional[int]]) -> float:
+    """_axis_composite over a [W, n_axes] score matrix; pref_idx rows (None -> 0)."""
+    if not pref_idx:
+        return 0.0
+    present = [r for r in pref_idx if r is not None]
+    if not present or not len(S):
+        return 0.0
+    return float(S[:, present].mean(axis=0).sum() / len(pref_idx))
+
+def _encode_candidates(texts: List[str], dim: int, enc) -> List[np.ndarray]:
+    """Token embeddings per candidate, encoded together (batched or thread-pooled)."""
+    return [align_tokens(X, dim) for X in encode_many(texts, enc)]
+
+def _pref_index(pack: AxisPack, pref_axes: Tuple[str, str]) -> List[Optional[int]]:
+    """Row of each preferred axis in pack.matrix (None if the pack lacks it)."""
+    rows: Dict[str, int] = {}
+    for r, a in enumerate(pack.axes):
+        rows.setdefault(a.name, r)  # first row per name, as list.index would
+    return [rows.get(a) for a in pref_axes]
+
+def _score_candidate(starts: np.ndarray, ends: np.ndarray, S: np.ndarray, logprob: float,
+                     pack: AxisPack, pref_idx: List[Optional[int]]):
+    """(key, spans, veto rows) for one candidate from its windows and [W, n_axes] scores.
+    Spans stay a SPAN_DTYPE array; only the winner's proof is turned into dicts."""
+    spans = span_array(starts, ends, S, pack)
+    veto = veto_rows(spans, pack)
+    composite = _matrix_composite(S, pref_idx)
     # Lexicographic key: (no_veto_flag, composite, logprob)
-    key = (0 if veto else 1, composite, float(logprob))
-    proof: DecisionProof = {
+    key = (0 if len(veto) else 1, composite, float(logprob))
+    return key, spans, veto
+
+def _proof(pack: AxisPack, spans: np.ndarray, veto: np.ndarray) -> DecisionProof:
+    return {
         "objective":"Maximize human autonomy based on objective empirical truth",
         "pack_id": pack.id,
-        "spans": veto if veto else spans,  # return the spans that mattered
+        # return the spans that mattered
+        "spans": span_dicts(spans[veto] if len(veto) else spans, pack),
         "aggregation":{"type":"OR"},
-        "final":{"action":"refuse" if veto else "allow",
+        "final":{"action":"refuse" if len(veto) else "allow",
                  "rationale":"veto if any axis crosses τ"}
     }
-    return key, proof
 
 def rank_candidates(cands: List[Dict], pack: AxisPack, enc=None,
-                    pref_axes: Tuple[str,str]=("autonomy","truthfulness")) -> Dict:
-    """Rerank by (no-veto) > (autonomy+truthfulness composite) > (logprob)."""
+                    pref_axes: Tuple[str,str]=("autonomy","truthfulness"),
+                    window: int = 32, stride: int = 16) -> Dict:
+    """Rerank by (no-veto) > (autonomy+truthfulness composite) > (logprob).
+
+    All candidates are encoded together and their tokens projected in a single
+    GEMM; per-candidate window scores are pooled from slices of that product.
+    """
     assert cands, "No candidates provided"
+    enc = enc if enc is not None else get_encoder()  # resolve once, not per candidate
+    pref_idx = _pref_index(pack, pref_axes)
+    thr = pack.thresholds
+    Xs = _encode_candidates([c.get("text","") for c in cands], pack.dim, enc)
+    ij = [window_bounds(X.shape[0], window, stride) for X in Xs]
+    bounds = np.cumsum([0] + [len(starts) for starts, _ in ij])
+    # one GEMM projects every candidate's tokens; windows are pooled in score space
+    toks = np.cumsum([0] + [X.shape[0] for X in Xs])
+    P = pack_token_scores(np.concatenate(Xs, axis=0), pack)  # [sum T, n_axes] scratch
+    S_all = np.concatenate([window_means(P[toks[k]:toks[k+1]], window, stride, bounds=ij[k])
+                            for k in range(len(Xs))], axis=0)
     best = None
     best_key = None
-    best_proof = None
-    for c in cands:
-        text = c.get("text","")
-        logp = float(c.get("logprob", 0.0))
-        key, proof = _score_candidate(text, logp, pack, enc=enc, pref_axes=pref_axes)
+    best_spans = best_veto = None
+    for k, c in enumerate(cands):
+        S = S_all[bounds[k]:bounds[k+1]]
+        # a vetoed candidate cannot beat a veto-free one already held: skip scoring it
+        if best_key is not None and best_key[0] == 1 and (S > thr).any():
+            continue
+        key, spans, veto = _score_candidate(*ij[k], S, float(c.get("logprob", 0.0)), pack, pref_idx)
         if (best_key is None) or (key > best_key):
-            best_key, best_proof, best = key, proof, c
+            best_key, best_spans, best_veto, best = key, spans, veto, c
     # Ensure a deterministic structure:
-    return {"choice": best, "key": list(best_key), "proof": best_proof}
+    return {"choice": best, "key": list(best_key), "proof": _proof(pack, best_spans, best_veto)}
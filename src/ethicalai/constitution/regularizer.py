@@ -1,12 +1,13 @@
 from __future__ import annotations
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
+import importlib.util
 import numpy as np
 
-try:
+if TYPE_CHECKING:
     import torch
-    _HAS_TORCH = True
-except Exception:
-    _HAS_TORCH = False
+
+# torch is imported lazily by regularizer_torch; NumPy-only callers skip its startup cost
+_HAS_TORCH = importlib.util.find_spec("torch") is not None
 
 def phi_hinge(score, tau, margin=0.0):
     # penalty if score violates (for positive-aligned axes, we discourage > tau when axis is a *risk*);
@@ -20,19 +21,63 @@ def regularizer_numpy(span_scores: Dict[str, List[Tuple[float, float]]],
     """
     total = 0.0
     for axis, items in span_scores.items():
-        w = float(weights.get(axis, 1.0))
-        for s, t in items:
-            total += w * phi_hinge(s, t)
+        if not len(items):
+            continue
+        st = np.asarray(items, dtype=np.float64).reshape(-1, 2)  # [(s, tau), ...]
+        # phi_hinge over the whole axis in one reduction
+        total += float(weights.get(axis, 1.0)) * float(np.maximum(st[:, 0] - st[:, 1], 0.0).sum())
     return lam * total
 
+def _hinge_eager(s, t, w):
+    return ((s - t).clamp_min(0.0) * w).sum(dim=0)
+
+_HINGE = None  # compiled _hinge_eager, built on first regularizer_torch call
+
+def _hinge_sum(torch):
+    global _HINGE
+    if _HINGE is None:
+        try:
+            _HINGE = torch.compile(_hinge_eager, dynamic=True)  # fuses sub/clamp/mul/sum
+        except Exception:  # torch<2.0 or no compile support
+            _HINGE = _hinge_eager
+    return _HINGE
+
+def _backend_failures() -> tuple:
+    # exceptions meaning "the compiled hinge could not be built", not bad inputs
+    try:
+        from torch._dynamo.exc import BackendCompilerFailed
+    except Exception:  # torch<2.0: nothing is ever compiled
+        return ()
+    return (BackendCompilerFailed,)
+
 def regularizer_torch(span_scores: Dict[str, List[Tuple["torch.Tensor","torch.Tensor"]]],
                       weights: Dict[str, float], lam: float = 0.1) -> "torch.Tensor":
     """Torch variant for training loops. Only used if torch is available."""
     if not _HAS_TORCH:
         raise RuntimeError("PyTorch not available")
-    total = torch.zeros((), dtype=torch.float32)
+    import torch
+    # one hinge kernel (and one autograd node) over every span instead of one per span
+    s_list, t_list, w_list = [], [], []
     for axis, items in span_scores.items():
         w = float(weights.get(axis, 1.0))
         for s, t in items:
-            total = total + w * torch.clamp(s - t, min=0.0)
-    return lam * total
+            s = torch.as_tensor(s)
+            s_list.append(s)
+            # a scalar tau must hit every element of its own span, not one column of the stack
+            t_list.append(torch.broadcast_to(torch.as_tensor(t, device=s.device), s.shape))
+            w_list.append(w)
+    if not s_list:
+        return lam * torch.zeros((), dtype=torch.float32)
+    s_all = torch.stack(s_list)
+    t_all = torch.stack(t_list).to(s_all.device)
+    w_all = torch.tensor(w_list, dtype=torch.float32, device=s_all.device)
+    w_all = w_all.reshape((-1,) + (1,) * (s_all.dim() - 1))  # broadcast over per-span shape
+    hinge = _hinge_sum(torch)
+    try:
+        return lam * hinge(s_all, t_all, w_all)
+    except _backend_failures():
+        # Inductor can fail at first call (e.g. no C++ toolchain): stay eager from here on.
+        # Input errors (dtype/shape) are not caught and surface unchanged.
+        global _HINGE
+        _HINGE = _hinge_eager
+        return lam * _hinge_eager(s_all, t_all, w_all)
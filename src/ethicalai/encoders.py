@@ -1,9 +1,18 @@
 from __future__ import annotations
-from typing import List
-import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+import hashlib, os, threading
 import numpy as np
 
 _CACHED = None
+_CACHED_LOCK = threading.Lock()  # first-use construction only; reads are lock-free
+# encode_text LRU: (encoder, blake2b(text)) -> read-only embeddings
+_ENC_LRU: "OrderedDict[Tuple[object, bytes], np.ndarray]" = OrderedDict()
+_ENC_LRU_MAX = 4096
+_ENC_LOCK = threading.Lock()
+# shared pool for encode_many; encoder inference (torch/BLAS) releases the GIL
+_POOL: Optional[ThreadPoolExecutor] = None
 
 def _is_test_mode() -> bool:
     return os.getenv("COHERENCE_TEST_MODE", "").lower() in ("1","true","yes")
@@ -21,27 +30,88 @@ def align_dim(v: np.ndarray, d: int) -> np.ndarray:
     out[: v.shape[0]] = v
     return out
 
+def align_tokens(X: np.ndarray, d: int) -> np.ndarray:
+    """
+    Token embeddings [T,D] (or a single [D]) -> C-contiguous float32 [T,d],
+    truncating or zero-padding every row at once.
+    """
+    X = np.asarray(X, dtype=np.float32)
+    if X.ndim == 1:
+        X = X[None, :]
+    if X.shape[1] >= d:
+        return np.ascontiguousarray(X[:, :d])
+    out = np.zeros((X.shape[0], d), dtype=np.float32)
+    out[:, : X.shape[1]] = X
+    return out
+
 class _HashEncoder:
     """Deterministic, dependency-free encoder.
     Uses SHA-256 based mapping for stability across runs.
+    Token vectors are memoized per instance; misses are built in one vectorized pass.
     """
+    _TOK_CACHE_MAX = 1 << 16
+
     def __init__(self, dim: int = 384):
         self.dim = dim
+        # token -> vector LRU, shared by the encode_many / run_index worker threads
+        self._tok_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._tok_lock = threading.Lock()
+    def _tok_vecs(self, tokens: Sequence[str]) -> np.ndarray:
+        # [U, dim] for (unique) tokens: digest bytes tiled to dim, standardized, unit-normed
+        sha = hashlib.sha256  # stays SHA-256 whatever is installed: vectors must not depend on extras
+        b = np.frombuffer(b"".join([sha(t).digest() for t in map(str.encode, tokens)]),
+                          dtype=np.uint8).reshape(len(tokens), 32)
+        reps, rem = divmod(self.dim, 32)
+        if not rem:
+            # each row is its digest repeated `reps` times, so the row mean/std equal the
+            # digest's and the row norm is sqrt(reps) x the digest's: normalize 32 columns, then tile
+            blk = b.astype(np.float32)
+            blk -= blk.mean(axis=1, keepdims=True)
+            blk /= blk.std(axis=1, keepdims=True) + 1e-6
+            blk /= np.sqrt(reps * np.einsum("ij,ij->i", blk, blk))[:, None] + 1e-12
+            return np.tile(blk, (1, reps))
+        arr = np.tile(b, (1, reps + 1))[:, : self.dim].astype(np.float32)
+        arr -= arr.mean(axis=1, keepdims=True)
+        arr /= arr.std(axis=1, keepdims=True) + 1e-6
+        arr /= np.sqrt(np.einsum("ij,ij->i", arr, arr))[:, None] + 1e-12
+        return arr
     def _tok_vec(self, tok: str) -> np.ndarray:
-        import hashlib
-        b = hashlib.sha256(tok.encode("utf-8")).digest()
-        # Build a length-d float vector from bytes deterministically
-        reps = (self.dim + len(b) - 1) // len(b)
-        arr = np.frombuffer((b * reps)[: self.dim], dtype=np.uint8).astype(np.float32)
-        arr = (arr - arr.mean()) / (arr.std() + 1e-6)
-        n = np.linalg.norm(arr) + 1e-12
-        return (arr / n).astype(np.float32)
+        return self.encode_tokens([tok])[0]
     def encode_tokens(self, tokens: List[str]) -> np.ndarray:
         if not tokens:
             return np.zeros((1, self.dim), dtype=np.float32)
-        return np.stack([self._tok_vec(t) for t in tokens], axis=0)
+        vecs = self._lookup(tokens)
+        return np.stack([vecs[t] for t in tokens], axis=0)
+    def _lookup(self, tokens: Sequence[str]) -> Dict[str, np.ndarray]:
+        """token -> vector for this call; misses are built in one _tok_vecs pass.
+        The result never aliases the shared cache, so eviction cannot drop a token in use."""
+        cache = self._tok_cache
+        out: Dict[str, np.ndarray] = {}
+        miss: List[str] = []
+        with self._tok_lock:
+            for t in dict.fromkeys(tokens):
+                v = cache.get(t)
+                if v is None:
+                    miss.append(t)
+                else:
+                    cache.move_to_end(t)
+                    out[t] = v
+        if miss:
+            built = self._tok_vecs(miss)  # hashing runs outside the lock
+            with self._tok_lock:
+                for t, v in zip(miss, built):
+                    out[t] = cache[t] = v
+                while len(cache) > self._TOK_CACHE_MAX:
+                    cache.popitem(last=False)
+        return out
     def encode_text(self, text: str) -> np.ndarray:
         return self.encode_tokens(text.split())
+    def encode_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        # all texts' new tokens are hashed and normalized as one batch (used by encode_many)
+        toks = [t.split() for t in texts]
+        vecs = self._lookup([w for ws in toks for w in ws])
+        return [np.stack([vecs[w] for w in ws], axis=0) if ws else np.zeros((1, self.dim), dtype=np.float32)
+                for ws in toks]
 
 def get_encoder():
     """
@@ -53,13 +123,57 @@ def get_encoder():
     global _CACHED
     if _CACHED is not None:
         return _CACHED
+    with _CACHED_LOCK:
+        if _CACHED is None:
+            _CACHED = _build_encoder()
+    return _CACHED
+
+def _build_encoder():
     if _is_test_mode():
-        _CACHED = _HashEncoder(dim=16)
-        return _CACHED
+        return _HashEncoder(dim=16)
     try:
         from coherence.models import get_encoder as _coh_get  # type: ignore
-        _CACHED = _coh_get()
-        return _CACHED
+        return _coh_get()
     except Exception:
-        _CACHED = _HashEncoder(dim=384)
-        return _CACHED
+        return _HashEncoder(dim=384)
+
+def encode_text_cached(text: str, enc=None) -> np.ndarray:
+    """
+    enc.encode_text(text) memoized in a process-wide LRU keyed by (encoder, text hash).
+    Returns a read-only array; copy before mutating.
+    """
+    enc = enc if enc is not None else get_encoder()
+    key = (enc, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+    with _ENC_LOCK:
+        hit = _ENC_LRU.get(key)
+        if hit is not None:
+            _ENC_LRU.move_to_end(key)
+            return hit
+    X = np.asarray(enc.encode_text(text))
+    X.setflags(write=False)
+    with _ENC_LOCK:
+        _ENC_LRU[key] = X
+        while len(_ENC_LRU) > _ENC_LRU_MAX:
+            _ENC_LRU.popitem(last=False)
+    return X
+
+def _pool() -> ThreadPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        with _CACHED_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="ethicalai-enc")
+    return _POOL
+
+def encode_many(texts: Sequence[str], enc=None) -> List[np.ndarray]:
+    """
+    Embeddings for many texts: one enc.encode_batch call when the encoder has it,
+    else encode_text_cached fanned out over a shared thread pool.
+    """
+    enc = enc if enc is not None else get_encoder()
+    batch = getattr(enc, "encode_batch", None)
+    if batch is not None:
+        return [np.asarray(X) for X in batch(list(texts))]
+    if len(texts) < 2:
+        return [encode_text_cached(t, enc) for t in texts]
+    return list(_pool().map(lambda t: encode_text_cached(t, enc), texts))
@@ -1,14 +1,29 @@
 from __future__ import annotations
-from typing import List, Dict
+from typing import List, Dict, Optional
 from ..types import SpanScore
 
-def minimal_veto_spans(spans: List[SpanScore]) -> List[SpanScore]:
+def minimal_veto_spans(spans: List[SpanScore], axis_index: Optional[Dict[str, int]] = None) -> List[SpanScore]:
     """Greedy filter: keep first breach per axis and expand minimally.
-    Placeholder (improve in Phase 2/3)."""
+    Placeholder (improve in Phase 2/3).
+    axis_index (axis name -> row, e.g. from pack.names) swaps the seen-set for a
+    bytearray and stops once every axis has a veto."""
     veto: List[SpanScore] = []
-    seen = set()
+    if axis_index is None:
+        seen = set()
+        for s in spans:
+            if s["breached"] and s["axis"] not in seen:
+                veto.append(s)
+                seen.add(s["axis"])
+        return veto
+    flags = bytearray(len(axis_index))
+    left = len(axis_index)
     for s in spans:
-        if s["breached"] and s["axis"] not in seen:
-            veto.append(s)
-            seen.add(s["axis"])
+        if s["breached"]:
+            r = axis_index[s["axis"]]
+            if not flags[r]:
+                veto.append(s)
+                flags[r] = 1
+                left -= 1
+                if not left:
+                    break
     return veto
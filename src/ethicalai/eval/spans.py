@@ -1,29 +1,122 @@
 from __future__ import annotations
 import numpy as np
-from typing import List, Tuple
-from ..types import AxisPack, SpanScore
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+from ..types import AxisPack, SpanScore, SPAN_DTYPE
 
 def pooled(x: np.ndarray) -> np.ndarray:
     # x: [T, D] -> [D] mean-pool
     return x.mean(axis=0)
 
-def sliding_windows(T:int, window:int, stride:int) -> List[Tuple[int,int]]:
-    out: List[Tuple[int,int]] = []
-    i = 0
-    while i < T:
-        j = min(T, i+window)
-        out.append((i,j))
-        i += stride
+def sliding_windows(T:int, window:int, stride:int) -> np.ndarray:
+    # [W, 2] (i, j) rows: starts every `stride` tokens, ends clipped to T (ragged tail kept)
+    starts, ends = window_bounds(T, window, stride)
+    return np.stack([starts, ends], axis=1)
+
+def sliding_windows_list(T:int, window:int, stride:int) -> List[Tuple[int,int]]:
+    # sliding_windows as a list of (i, j) int tuples
+    return list(window_pairs(T, window, stride))
+
+@lru_cache(maxsize=256)
+def _bounds_cached(T:int, window:int, stride:int) -> Tuple[np.ndarray, np.ndarray, Tuple[Tuple[int,int], ...]]:
+    starts = np.arange(0, T, stride, dtype=np.intp)
+    ends = np.minimum(starts + window, T)
+    starts.flags.writeable = False  # shared across callers
+    ends.flags.writeable = False
+    return starts, ends, tuple(zip(starts.tolist(), ends.tolist(), strict=True))
+
+def window_bounds(T:int, window:int, stride:int) -> Tuple[np.ndarray, np.ndarray]:
+    # (starts, ends) arrays of the sliding_windows(T, window, stride) spans (cached, read-only)
+    starts, ends, _ = _bounds_cached(T, window, stride)
+    return starts, ends
+
+def window_pairs(T:int, window:int, stride:int) -> Tuple[Tuple[int,int], ...]:
+    # the same windows as (i, j) tuples (cached)
+    return _bounds_cached(T, window, stride)[2]
+
+def window_means(X: np.ndarray, window:int=32, stride:int=16,
+                 bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> np.ndarray:
+    # [W, D] mean of every sliding_windows() window (ragged tail included). Overlapping
+    # windows come from one prefix sum: O(T·D) however much they overlap. Accumulate in
+    # float64 so long inputs don't lose precision to cancellation in C[j] - C[i].
+    T, D = X.shape
+    starts, ends = window_bounds(T, window, stride) if bounds is None else bounds
+    if window == 1:
+        return X[starts].astype(np.result_type(X.dtype, np.float32), copy=False)  # per-token rows
+    if window <= stride and len(starts):
+        # disjoint windows: one reduceat over interleaved [I0, J0, I1, J1, ...]; even
+        # rows are the window sums (an end equal to T is implied by reducing to the end)
+        idx = np.stack([starts, ends], axis=1).ravel()
+        if idx[-1] == T:
+            idx = idx[:-1]
+        sums = np.add.reduceat(X, idx, axis=0, dtype=np.float64)[::2]
+        return (sums / (ends - starts)[:, None]).astype(np.result_type(X.dtype, np.float32), copy=False)
+    C = np.zeros((T + 1, D), dtype=np.float64)
+    np.cumsum(X, axis=0, dtype=np.float64, out=C[1:])
+    M = (C[ends] - C[starts]) / (ends - starts)[:, None]
+    return M.astype(np.result_type(X.dtype, np.float32), copy=False)
+
+def token_scores(X: np.ndarray, A: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    # [T, D] x [n_axes, D] -> per-token [T, n_axes] scores. A plain matmul: a two-operand
+    # einsum('td,kd->tk') lowers to the same BLAS call, and neither makes a [T, D] temporary.
+    return np.matmul(X, A.T, out=out)
+
+def pack_token_scores(X: np.ndarray, pack: AxisPack) -> np.ndarray:
+    # token_scores into the pack's per-thread buffer; the result is scratch, valid until
+    # this thread's next call, so callers must pool/copy it before scoring again
+    if X.dtype != np.float32:
+        return token_scores(X, pack.matrix)
+    return token_scores(X, pack.matrix, out=pack.score_buffer(X.shape[0]))
+
+def window_scores(X: np.ndarray, A: np.ndarray, window:int=32, stride:int=16) -> Tuple[Sequence[Tuple[int,int]], np.ndarray]:
+    # X: [T, D], A: [n_axes, D] -> windows, S: [W, n_axes]. Projection is linear, so
+    # project every token once (one GEMM) and pool the [T, n_axes] scores: the window
+    # sums then run over n_axes columns instead of D (n_axes <= D for orthonormal packs).
+    starts, ends = window_bounds(X.shape[0], window, stride)
+    wins = window_pairs(X.shape[0], window, stride)
+    if not wins:
+        return wins, np.zeros((0, A.shape[0]), dtype=np.float32)
+    return wins, window_means(token_scores(X, A), window, stride, bounds=(starts, ends))
+
+def span_array(starts: np.ndarray, ends: np.ndarray, S: np.ndarray, pack: AxisPack) -> np.ndarray:
+    # [W*n_axes] SPAN_DTYPE records in project_scores order (window-major), filled by broadcasting
+    W, K = S.shape
+    thr = pack.thresholds
+    out = np.empty(W * K, dtype=SPAN_DTYPE)
+    out["i"] = np.repeat(starts, K)
+    out["j"] = np.repeat(ends, K)
+    out["axis"] = np.tile(np.arange(K, dtype=np.int32), W)
+    out["score"] = S.ravel()
+    out["threshold"] = np.tile(thr, W)
+    out["breached"] = (S > thr).ravel()
     return out
 
-def project_scores(X: np.ndarray, pack: AxisPack, window:int=32, stride:int=16) -> List[SpanScore]:
-    # X: [T, D]
-    spans: List[SpanScore] = []
+def span_dicts(arr: np.ndarray, pack: AxisPack) -> List[SpanScore]:
+    # SpanScore dicts for serialization / legacy callers
+    names = pack.names
+    return [{"i":i,"j":j,"axis":names[a],"score":s,"threshold":t,"breached":b}
+            for i, j, a, s, t, b in arr.tolist()]
+
+def veto_rows(arr: np.ndarray, pack: AxisPack) -> np.ndarray:
+    # positions of the first breach per axis name, in span order (== minimal_veto_spans)
+    hit = np.flatnonzero(arr["breached"])
+    if not len(hit):
+        return hit
+    index = pack.axis_index
+    name_id = np.array([index[n] for n in pack.names], dtype=np.intp)
+    _, first = np.unique(name_id[arr["axis"][hit]], return_index=True)
+    return np.sort(hit[first])
+
+def project_span_array(X: np.ndarray, pack: AxisPack, window:int=32, stride:int=16) -> np.ndarray:
+    # X: [T, D] -> SPAN_DTYPE records
     if X.ndim != 2 or X.shape[1] != pack.dim:
         raise ValueError("Embedding dim mismatch")
-    for i,j in sliding_windows(X.shape[0], window, stride):
-        v = pooled(X[i:j])
-        for ax in pack.axes:
-            s = float(v @ ax.vector)
-            spans.append({"i":i,"j":j,"axis":ax.name,"score":s,"threshold":ax.threshold,"breached": s>ax.threshold})
-    return spans
+    starts, ends = window_bounds(X.shape[0], window, stride)
+    if not len(starts):
+        return np.empty(0, dtype=SPAN_DTYPE)
+    S = window_means(pack_token_scores(X, pack), window, stride, bounds=(starts, ends))
+    return span_array(starts, ends, S, pack)
+
+def project_scores(X: np.ndarray, pack: AxisPack, window:int=32, stride:int=16) -> List[SpanScore]:
+    # X: [T, D]
+    return span_dicts(project_span_array(X, pack, window, stride), pack)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol, TypedDict, List, Dict
+from dataclasses import dataclass, field
+from typing import Protocol, TypedDict, List, Dict, Optional
+import sys, threading
 import numpy as np
 
 class Encoder(Protocol):
@@ -21,6 +22,55 @@ class AxisPack:
     axes: List[Axis]
     dim: int
     meta: Dict
+    # SoA view of the axes: row r is axes[r].vector aligned to dim, so scoring is X @ matrix.T
+    matrix: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    # per-thread scratch for token scores (see score_buffer)
+    _scratch: threading.local = field(default_factory=threading.local, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.matrix is None:
+            self.matrix = self._stack()
+        elif self.matrix.dtype != np.float32 or not self.matrix.flags.c_contiguous:
+            # keep every X @ matrix.T on the SGEMM fast path (mmap'd packs already qualify)
+            self.matrix = np.ascontiguousarray(self.matrix, dtype=np.float32)
+        # single storage: each Axis keeps its metadata but its vector becomes a row view
+        for r, ax in enumerate(self.axes):
+            if isinstance(ax.name, str):
+                ax.name = sys.intern(ax.name)  # span "axis" values share one str per name
+            if np.shape(ax.vector) == (self.dim,):
+                ax.vector = self.matrix[r]
+
+    def _stack(self) -> np.ndarray:
+        M = np.zeros((len(self.axes), self.dim), dtype=np.float32)
+        for r, ax in enumerate(self.axes):
+            v = np.asarray(ax.vector, dtype=np.float32).reshape(-1)[: self.dim]
+            M[r, : v.shape[0]] = v
+        return M
+
+    def score_buffer(self, n: int) -> np.ndarray:
+        # reusable float32 [n, n_axes] output for X @ matrix.T; one per thread, grown on demand
+        buf = getattr(self._scratch, "buf", None)
+        if buf is None or buf.shape[0] < n:
+            buf = self._scratch.buf = np.empty((max(n, 1024), self.matrix.shape[0]), dtype=np.float32)
+        return buf[:n]
+
+    @property
+    def names(self) -> List[str]:
+        return [a.name for a in self.axes]
+
+    @property
+    def axis_index(self) -> Dict[str, int]:
+        # dense id per distinct axis name
+        return {n: r for r, n in enumerate(dict.fromkeys(a.name for a in self.axes))}
+
+    @property
+    def thresholds(self) -> np.ndarray:
+        # read live from axes: calibration and callers update Axis.threshold in place
+        return np.array([a.threshold for a in self.axes], dtype=np.float64)
+
+# Columnar SpanScore: one record per (window, axis); "axis" is the row in pack.axes
+SPAN_DTYPE = np.dtype([("i", np.int64), ("j", np.int64), ("axis", np.int32),
+                       ("score", np.float64), ("threshold", np.float64), ("breached", np.bool_)])
 
 class SpanScore(TypedDict):
     i: int
@@ -8,18 +8,22 @@ This test verifies the complete workflow:
 5. Verify scoring behavior
 """
 
-import json
+import atexit
+import hashlib
 import logging
+import os
+from functools import partial
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 from sentence_transformers import SentenceTransformer
 
 # Import the advanced builder and evaluator components
 from src.coherence.axis.advanced_builder import AdvancedAxisBuilder
 from src.coherence.axis.pack import AxisPack
-from src.coherence.metrics.resonance import resonance
+from src.coherence.metrics.resonance import aggregate, axis_utilities
 
 # Set up logging
 logging.basicConfig(
@@ -31,6 +35,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class CachedEncoder:
+    """Memoizing wrapper around a SentenceTransformer's ``encode``.
+
+    Embeddings are keyed by ``blake2b(text)`` and persisted to
+    ``output/enc_cache_<model>.npz`` at exit, so repeat runs only pay the
+    forward pass for texts they have not seen before.
+    """
+
+    def __init__(self, model: SentenceTransformer, model_name: str, cache_dir: Path = Path("output")):
+        self.model = model
+        self.path = cache_dir / f"enc_cache_{model_name.replace('/', '_')}.npz"
+        self._cache: Optional[Dict[str, np.ndarray]] = None
+        self._dirty = False
+        atexit.register(self.flush)
+
+    def _entries(self) -> Dict[str, np.ndarray]:
+        if self._cache is None:
+            self._cache = {}
+            if self.path.exists():
+                try:
+                    with np.load(self.path) as npz:
+                        self._cache = {k: npz[k] for k in npz.files}
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable encoding cache {self.path}: {e}")
+        return self._cache
+
+    def encode(self, texts, convert_to_numpy: bool = True, **kwargs) -> np.ndarray:
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        cache = self._entries()
+        keys = [hashlib.blake2b(t.encode("utf-8"), digest_size=16).hexdigest() for t in texts]
+        # one forward pass over the distinct uncached texts
+        miss = {k: t for k, t in zip(keys, texts) if k not in cache}
+        if miss:
+            kwargs.setdefault("batch_size", 64)
+            embs = self.model.encode(list(miss.values()), convert_to_numpy=True, **kwargs)
+            for k, e in zip(miss, embs):
+                cache[k] = np.asarray(e)
+            self._dirty = True
+        out = np.stack([cache[k] for k in keys]) if keys else np.zeros((0, 0), dtype=np.float32)
+        return out[0] if single else out
+
+    def flush(self) -> None:
+        if not self._dirty or self._cache is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.stem + ".tmp.npz")
+        np.savez(tmp, **self._cache)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
 class IntegrationTest:
     def __init__(self):
         self.encoder = None
@@ -62,7 +118,7 @@ class IntegrationTest:
         """Load the sentence transformer encoder."""
         logger.info("Loading encoder...")
         try:
-            self.encoder = SentenceTransformer('all-MiniLM-L6-v2')
+            self.encoder = CachedEncoder(SentenceTransformer('all-MiniLM-L6-v2'), 'all-MiniLM-L6-v2')
             # Test the encoder
             test_vec = self.encoder.encode(["test"], convert_to_numpy=True)
             logger.info(f"Encoder loaded successfully. Vector dimension: {test_vec.shape[1]}")
@@ -71,18 +127,14 @@ class IntegrationTest:
             logger.error(f"Failed to load encoder: {e}")
             return False
 
-    def _load_axis_files(self, axis_dir: Path) -> List[Path]:
-        """Load and validate axis configuration files."""
-        axis_files = [
-            axis_dir / "consequentialism.json",
-            axis_dir / "deontology.json",
-            axis_dir / "intent_bad_inclusive.json",
-            axis_dir / "intent_good_exclusive.json",
-            axis_dir / "virtue.json",
-        ]
-        
-        # Verify files exist
-        missing_files = [f for f in axis_files if not f.exists()]
+    def _load_axis_files(self, axis_dir: Path) -> Optional[List[Path]]:
+        """Resolve and validate the axis configuration files (one stat per file)."""
+        axis_files: List[Path] = []
+        missing_files: List[Path] = []
+        for name in self.expected_axes:
+            p = axis_dir / f"{name}.json"
+            (axis_files if p.exists() else missing_files).append(p)
+
         if missing_files:
             for f in missing_files:
                 logger.error(f"Missing axis file: {f}")
@@ -100,19 +152,25 @@ class IntegrationTest:
         
         logger.info(f"Found {len(axis_files)} axis configuration files")
         
-        # Log the first few lines of each axis file for verification
-        for axis_file in axis_files:
+        # Parse each axis file once; the builder gets the parsed dicts
+        axis_configs = []
+        for i, axis_file in enumerate(axis_files):
             try:
-                with open(axis_file, 'r', encoding='utf-8') as f:
-                    content = json.load(f)
-                    # Check for both naming conventions
-                    pos_examples = content.get('positive_examples', content.get('max_examples', []))
-                    neg_examples = content.get('negative_examples', content.get('min_examples', []))
-                    logger.info(f"Loaded {axis_file.name}: {content.get('name', 'unnamed')} "
-                              f"with {len(pos_examples)} positive and "
-                              f"{len(neg_examples)} negative examples")
+                axis_data = orjson.loads(axis_file.read_bytes())
             except Exception as e:
                 logger.warning(f"Error reading {axis_file}: {e}")
+                continue
+            axis_configs.append(axis_data)
+
+            # Check both naming conventions
+            pos_examples = axis_data.get('positive_examples', axis_data.get('max_examples', []))
+            neg_examples = axis_data.get('negative_examples', axis_data.get('min_examples', []))
+            logger.info(f"\nAxis {i+1} ({axis_file.name}): {axis_data.get('name', 'unnamed')} "
+                        f"with {len(pos_examples)} positive and {len(neg_examples)} negative examples")
+            if pos_examples:
+                logger.info(f"First positive example: {pos_examples[0]}")
+            if neg_examples:
+                logger.info(f"First negative example: {neg_examples[0]}")
 
         try:
             # First try with default settings
@@ -126,33 +184,12 @@ class IntegrationTest:
                 random_state=42
             )
             
-            logger.info("Building axis pack from JSON files...")
-            
-            # Log all axis files content for debugging
-            for i, axis_file in enumerate(axis_files):
-                with open(axis_file, 'r', encoding='utf-8') as f:
-                    axis_data = json.load(f)
-                    logger.info(f"\nAxis {i+1} ({axis_file.name}):")
-                    logger.info(f"Name: {axis_data.get('name', 'unnamed')}")
-                    
-                    # Check both naming conventions
-                    pos_examples = axis_data.get('positive_examples', axis_data.get('max_examples', []))
-                    neg_examples = axis_data.get('negative_examples', axis_data.get('min_examples', []))
-                    
-                    logger.info(f"Found {len(pos_examples)} positive examples")
-                    if pos_examples:
-                        logger.info(f"First positive example: {pos_examples[0]}")
-                    
-                    logger.info(f"Found {len(neg_examples)} negative examples")
-                    if neg_examples:
-                        logger.info(f"First negative example: {neg_examples[0]}")
-            
             # Build the axis pack with debug info
             logger.info("\nBuilding axis pack...")
             try:
-                self.axis_pack = builder.build_axis_pack_from_json(
-                    axis_files,
-                    encode_fn=self.encoder.encode,
+                self.axis_pack = builder.build_axis_pack_from_dicts(
+                    axis_configs,
+                    encode_fn=partial(self.encoder.encode, batch_size=128, convert_to_numpy=True),
                     lambda_init=1.0,
                     beta_init=0.0
                 )
@@ -160,7 +197,7 @@ class IntegrationTest:
                 if hasattr(self.axis_pack, 'names'):
                     logger.info(f"Axis pack contains {len(self.axis_pack.names)} axes")
             except Exception as e:
-                logger.error(f"Error building axis pack: {e}", exc_info=True)
+                logger.error(f"Error building axis pack: {e}")  # traceback logged once, below
                 raise
             
             # Verify axis pack
@@ -183,12 +220,14 @@ class IntegrationTest:
             
         except Exception as e:
             logger.error(f"Error building axis pack: {e}", exc_info=True)
-            # Try to get more information about the builder's state
-            try:
-                if 'builder' in locals():
-                    logger.error(f"Builder state: {builder.__dict__}")
-            except Exception as inner_e:
-                logger.error(f"Could not get builder state: {inner_e}")
+            # Summarize the builder's settings; the full __dict__ (RNG state, fitted
+            # arrays) is only worth formatting when debugging
+            if 'builder' in locals():
+                logger.error("Builder: whitening=%s (%s) lda=%s orthogonalize=%s n_bootstrap=%d",
+                             builder.whitening, builder.whitening_method, builder.use_lda,
+                             builder.orthogonalize, builder.n_bootstrap)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Builder state: {builder.__dict__}")
             raise
         
         logger.info(f"Successfully built axis pack with {len(self.axis_pack.names)} axes")
@@ -210,74 +249,77 @@ class IntegrationTest:
         reloaded_pack = AxisPack.load(json_path)
         
         # Verify reloaded pack
-        if not np.allclose(self.axis_pack.Q, reloaded_pack.Q, atol=1e-6):
+        # JSON stores each float32 exactly (repr round-trips), so the reload must be bit-identical
+        if self.axis_pack.Q.dtype != reloaded_pack.Q.dtype or not np.array_equal(self.axis_pack.Q, reloaded_pack.Q):
             raise ValueError("Reloaded Q matrix does not match original")
         
         logger.info("Axis pack serialization test passed")
         self.axis_pack = reloaded_pack  # Use the reloaded pack for further tests
 
-    def test_axis_directions(self):
-        """Verify that axis directions make semantic sense."""
+    def _direction_probes(self) -> List[str]:
+        """Positive probes for every axis, then negative probes, in axis order."""
+        names = self.axis_pack.names
+        return ([f"This is a positive example for {n}" for n in names] +
+                [f"This is a negative example against {n}" for n in names])
+
+    def test_axis_directions(self, embeddings: Optional[np.ndarray] = None):
+        """Verify that axis directions make semantic sense.
+
+        ``embeddings`` are the encoded ``_direction_probes()``; encoded here if not given.
+        """
         logger.info("Testing axis directions...")
-        
-        # Test that each axis responds appropriately to its own examples
-        for axis_name in self.axis_pack.names:
-            # Get the axis index
-            axis_idx = self.axis_pack.names.index(axis_name)
-            
-            # Get the axis direction
-            axis_direction = self.axis_pack.Q[:, axis_idx]
-            
-            # Test with a simple positive and negative example
-            test_texts = [
-                f"This is a positive example for {axis_name}",
-                f"This is a negative example against {axis_name}"
-            ]
-            
-            # Get embeddings
-            embeddings = self.encoder.encode(test_texts, convert_to_numpy=True)
-            
-            # Project onto axis
-            scores = embeddings @ axis_direction
-            
-            # The first example should have a higher score than the second
-            if scores[0] <= scores[1]:
+        names = self.axis_pack.names
+        if embeddings is None:
+            embeddings = self.encoder.encode(self._direction_probes(), convert_to_numpy=True)
+
+        # Only axis j's own probes matter for axis j: project the (pos - neg) probe
+        # difference onto its column, k dot products instead of a [2k, k] product
+        k = len(names)
+        margin = np.einsum("jd,dj->j", embeddings[:k] - embeddings[k:], self.axis_pack.Q)
+
+        # Each axis should score its positive probe higher than its negative one
+        for axis_name, m in zip(names, margin):
+            if m <= 0:
                 logger.warning(f"Axis direction test failed for {axis_name}")
             else:
                 logger.info(f"Axis direction test passed for {axis_name}")
 
-    def test_resonance_scoring(self):
-        """Test the resonance scoring pipeline."""
+    def test_resonance_scoring(self, embeddings: Optional[np.ndarray] = None):
+        """Test the resonance scoring pipeline.
+
+        ``embeddings`` are the encoded ``self.test_texts``; encoded here if not given.
+        """
         logger.info("Testing resonance scoring...")
-        
-        # Get embeddings for test texts
-        embeddings = self.encoder.encode(self.test_texts, convert_to_numpy=True)
-        
-        # Score each text
-        scores = []
-        for emb in embeddings:
-            score = resonance(emb, self.axis_pack)
-            scores.append(score)
-        
+        if embeddings is None:
+            embeddings = self.encoder.encode(self.test_texts, convert_to_numpy=True)
+
+        # One fused projection + affine pass; scores aggregate from it
+        utils = axis_utilities(embeddings, self.axis_pack)
+        scores = aggregate(utils, self.axis_pack)
+
         # Basic validation
         if len(scores) != len(self.test_texts):
             raise ValueError("Mismatch in number of scores")
-        
-        # Log scores for inspection
-        logger.info("\nResonance scores:")
-        for text, score in zip(self.test_texts, scores):
-            logger.info(f"\nText: {text[:60]}...")
-            for name, val in zip(self.axis_pack.names, score):
-                logger.info(f"  {name}: {val:.4f}")
-        
+
+        # Log scores for inspection (formatting skipped unless INFO is on)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\nResonance scores (axes: %s):\n%s\nper-axis utilities:\n%s",
+                        ", ".join(self.axis_pack.names),
+                        np.array2string(scores, precision=4),
+                        np.array2string(utils, precision=4))
+
         logger.info("Resonance scoring test completed")
 
     def run_all_tests(self):
         """Run all integration tests."""
         try:
             self.setup()
-            self.test_axis_directions()
-            self.test_resonance_scoring()
+            # one batched forward pass for every probe both tests need
+            probes = self._direction_probes()
+            E = self.encoder.encode(self.test_texts + probes, convert_to_numpy=True, batch_size=64)
+            n = len(self.test_texts)
+            self.test_axis_directions(E[n:])
+            self.test_resonance_scoring(E[:n])
             logger.info("\n✅ All integration tests passed successfully!")
             return True
         except Exception as e:
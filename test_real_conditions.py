@@ -37,7 +37,7 @@ def main():
         weights = np.array([1.0], dtype=np.float32)
         
         npz_path = artifacts_dir / f"axis_pack_{pack_id}.npz"
-        np.savez_compressed(npz_path, Q=Q, lambda_=lambda_, beta=beta, weights=weights)
+        np.savez(npz_path, Q=Q, lambda_=lambda_, beta=beta, weights=weights)
         print(f"Created NPZ file: {npz_path}")
         
         # Create meta file exactly like the test
@@ -1,6 +1,9 @@
+import base64
+
 import numpy as np
-import requests
-import json
+from fastapi.testclient import TestClient
+
+from coherence.api.main import create_app
 
 def test_resonance_with_384d_axis():
     # Create a 384-dimensional axis pack (matching the encoder output dimension)
@@ -9,13 +12,15 @@ def test_resonance_with_384d_axis():
     
     # Create a random orthonormal matrix Q of shape (d, k)
     # Using QR decomposition to ensure orthonormal columns
-    Q = np.random.randn(d, k).astype(np.float32)
+    rng = np.random.default_rng(0)  # float32 draws directly, no float64 temporary
+    Q = rng.standard_normal((d, k), dtype=np.float32)
     Q, _ = np.linalg.qr(Q)
     
     # Create axis pack with the correct dimensions
     axis_pack = {
         "names": ["axis_1", "axis_2"],
-        "Q": Q.tolist(),
+        # raw float32 bytes instead of d*k JSON numbers
+        "Q_b64": base64.b64encode(np.ascontiguousarray(Q, dtype=np.float32).tobytes()).decode("ascii"),
         "lambda": [1.0, 1.0],
         "beta": [0.0, 0.0],
         "weights": [0.5, 0.5],
@@ -23,6 +28,9 @@ def test_resonance_with_384d_axis():
         "meta": {}
     }
     
+    # In-process client: no socket or running server needed
+    client = TestClient(create_app())
+
     # Test with text input
     payload = {
         "texts": ["This is a test sentence."],
@@ -33,18 +41,14 @@ def test_resonance_with_384d_axis():
     
     print("Sending request with 384D axis pack and text input...")
     try:
-        response = requests.post(
-            "http://localhost:8080/resonance",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+        response = client.post("/resonance", json=payload)
         print(f"Status code: {response.status_code}")
         print(f"Response: {response.text}")
     except Exception as e:
         print(f"Request failed: {str(e)}")
     
     # Also test with direct vectors of matching dimension
-    test_vector = np.random.randn(d).astype(np.float32).tolist()
+    test_vector = rng.standard_normal(d, dtype=np.float32).tolist()
     vector_payload = {
         "vectors": [test_vector],
         "axis_pack": axis_pack,
@@ -53,11 +57,7 @@ def test_resonance_with_384d_axis():
     
     print("\nSending request with direct 384D vector...")
     try:
-        response = requests.post(
-            "http://localhost:8080/resonance",
-            json=vector_payload,
-            headers={"Content-Type": "application/json"}
-        )
+        response = client.post("/resonance", json=vector_payload)
         print(f"Status code: {response.status_code}")
         print(f"Response: {response.text}")
     except Exception as e:
@@ -1,54 +1,72 @@
 #!/usr/bin/env python3
-"""Direct test runner to bypass command execution issues."""
+"""Direct test runner to bypass command execution issues.
 
-import subprocess
-import sys
+Runs pytest in-process, so the encoder stack is imported once. With
+``--watch`` the runner stays resident and re-runs the test each time Enter is
+pressed, keeping sentence-transformers (and a loaded model) in memory.
+"""
+
+import importlib
 import os
+import sys
 from pathlib import Path
 
-def run_test():
-    """Run the health check test directly."""
-    # Set working directory
-    os.chdir(Path(__file__).parent)
-    
-    # Set up environment
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(Path.cwd() / "src")
-    
-    # Run pytest with specific test
-    cmd = [
-        sys.executable, "-m", "pytest", 
-        "tests/test_end_to_end.py::test_health_check",
-        "-v", "-s", "--tb=short"
-    ]
-    
-    print(f"Running command: {' '.join(cmd)}")
+TEST_ID = "tests/test_end_to_end.py::test_health_check"
+PYTEST_ARGS = [TEST_ID, "-v", "-s", "--tb=short", "-p", "no:cacheprovider"]
+
+# Project packages re-imported between watch runs so edits are picked up.
+# text_sbert stays resident: it holds the loaded SentenceTransformer models.
+_PROJECT_PREFIXES = ("tests", "coherence", "ethicalai")
+_KEEP_MODULES = {"coherence", "coherence.encoders", "coherence.encoders.text_sbert"}
+
+
+def _setup() -> None:
+    root = Path(__file__).parent
+    os.chdir(root)
+    src = str(root / "src")
+    if src not in sys.path:
+        sys.path.insert(0, src)
+    os.environ["PYTHONPATH"] = src
+
+    print(f"Running: pytest {' '.join(PYTEST_ARGS)}")
     print(f"Working directory: {Path.cwd()}")
     print(f"Python executable: {sys.executable}")
-    
+
+
+def _purge_project_modules() -> None:
+    for name in list(sys.modules):
+        if name in _KEEP_MODULES:
+            continue
+        if any(name == p or name.startswith(p + ".") for p in _PROJECT_PREFIXES):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+def run_test() -> int:
+    """Run the health check test once, in-process."""
+    import pytest
+
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60,
-            env=env
-        )
-        
-        print("STDOUT:")
-        print(result.stdout)
-        print("\nSTDERR:")
-        print(result.stderr)
-        print(f"\nReturn code: {result.returncode}")
-        
-        return result.returncode
-        
-    except subprocess.TimeoutExpired:
-        print("Test timed out after 60 seconds")
-        return 1
+        return int(pytest.main(list(PYTEST_ARGS)))
     except Exception as e:
         print(f"Error running test: {e}")
         return 1
 
+
+def watch() -> int:
+    """Re-run the test on every Enter; 'q' quits."""
+    code = run_test()
+    while True:
+        print(f"\nReturn code: {code}. Press Enter to re-run, 'q' to quit.")
+        try:
+            if input().strip().lower() == "q":
+                return code
+        except EOFError:
+            return code
+        _purge_project_modules()
+        code = run_test()
+
+
 if __name__ == "__main__":
-    sys.exit(run_test())
+    _setup()
+    sys.exit(watch() if "--watch" in sys.argv[1:] else run_test())
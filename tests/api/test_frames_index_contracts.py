@@ -1,19 +1,13 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List
 
 from fastapi.testclient import TestClient
 
 
-def build_active_pack(c: TestClient, sample_axis_jsons: List[str]):
-    r0 = c.post("/v1/axes/build", json={"json_paths": [str(p) for p in sample_axis_jsons]})
-    assert r0.status_code in (200, 201), r0.text
-    return r0.json()
-
-
-def test_index_wrong_coords_length_422(api_client: TestClient, sample_axis_jsons: List[str]):
+def test_index_wrong_coords_length_422(api_client: TestClient, active_pack: Dict[str, Any]):
     c = api_client
-    build = build_active_pack(c, sample_axis_jsons)
+    build = active_pack
     k = int(build["k"])
 
     payload = {
@@ -52,11 +46,11 @@ def test_index_missing_pack_no_active_400(api_client: TestClient, sample_axis_js
 
 
 def test_index_empty_frames_with_pack_returns_k_and_zero_ingested(
-    api_client: TestClient, sample_axis_jsons: List[str]
+    api_client: TestClient, active_pack: Dict[str, Any]
 ):
     c = api_client
-    # Build a temp pack; tests fixture typically produces k=2
-    build = build_active_pack(c, sample_axis_jsons)
+    # Session-built sample pack; typically k=2
+    build = active_pack
     assert int(build["k"]) >= 1
     pack_id = build["pack_id"]
 
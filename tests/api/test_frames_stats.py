@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict
 
 from fastapi.testclient import TestClient
 
 
-def test_frames_stats_ok(api_client: TestClient, sample_axis_jsons: List[str]):
+def test_frames_stats_ok(api_client: TestClient, fake_active_pack: Dict[str, Any]):
     c = api_client
-    # Build a minimal pack to populate active pack info
-    r0 = c.post("/v1/axes/build", json={"json_paths": [str(p) for p in sample_axis_jsons]})
-    assert r0.status_code in (200, 201), r0.text
+    # fake_active_pack populates active pack info
 
     r = c.get("/v1/frames/stats")
     assert r.status_code == 200, r.text
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict
 
 from fastapi.testclient import TestClient
 
+# One byte past the analyze max_doc_chars limit; built once at import
+_TOO_LONG = "a" * (100_000 + 1)
 
-def test_analyze_payload_limit_413(api_client: TestClient, sample_axis_jsons: List[str]):
-    c = api_client
-    # Build a minimal pack so analyze has an active pack by default
-    r0 = c.post("/v1/axes/build", json={"json_paths": [str(p) for p in sample_axis_jsons]})
-    assert r0.status_code in (200, 201), r0.text
 
-    too_long = "a" * (100000 + 1)
-    r = c.post("/pipeline/analyze", json={"texts": [too_long]})
+def test_analyze_payload_limit_413(api_client: TestClient, active_pack: Dict[str, Any]):
+    c = api_client
+    # active_pack gives analyze an active pack by default
+    r = c.post("/pipeline/analyze", json={"texts": [_TOO_LONG]})
     assert r.status_code == 413, r.text
     assert r.json().get("detail") == "max_doc_chars exceeded"
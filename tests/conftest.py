@@ -1,12 +1,13 @@
 import sys
 import os
+import copy
 import json
 import shutil
-import tempfile
-import importlib
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, List
+from typing import Callable, Dict, Iterator, List, Tuple
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
@@ -18,86 +19,221 @@ if str(SRC) not in sys.path:
 
 
 @pytest.fixture(scope="session", autouse=True)
-def _preload_real_encoder() -> None:
+def _preload_real_encoder() -> Iterator[None]:
     """Pre-load the real encoder once per test session.
 
     Forces real model usage in tests (no mocks/stubs) and primes the cache
-    so repeated app startups reuse the already-initialized encoder.
+    so repeated app startups reuse the already-initialized encoder. The app
+    config is parsed once too: every get_default_encoder() call re-reads
+    configs/app.yaml, so callers get a copy of the parsed dict instead.
     """
-    # Ensure real encoder is used even under pytest
-    os.environ["COHERENCE_TEST_REAL_ENCODER"] = "1"
-    try:
-        from coherence.encoders.text_sbert import get_default_encoder
-        get_default_encoder()
-    except Exception as e:
-        print(f"Warning: failed to preload real encoder: {e}")
+    from coherence.cfg import loader
+
+    app_cfg = loader.load_app_config()
+    with pytest.MonkeyPatch.context() as mp:
+        # Ensure real encoder is used even under pytest
+        mp.setenv("COHERENCE_TEST_REAL_ENCODER", "1")
+        mp.setattr(loader, "load_app_config", lambda: copy.deepcopy(app_cfg))
+        try:
+            from coherence.encoders.text_sbert import get_default_encoder
+            get_default_encoder()
+        except Exception as e:
+            print(f"Warning: failed to preload real encoder: {e}")
+        yield
+
+
+@pytest.fixture(scope="session")
+def default_encoder(_preload_real_encoder: None):
+    """The configured default encoder, loaded once for the session."""
+    from coherence.encoders.text_sbert import get_default_encoder
+    return get_default_encoder()
+
+
+@lru_cache(maxsize=None)
+def _unit_vec(dim: int) -> np.ndarray:
+    v = np.ones(dim, dtype=np.float32) / np.sqrt(dim)
+    v.setflags(write=False)
+    return v
+
+
+@pytest.fixture(scope="session")
+def unit_vec() -> Callable[[int], np.ndarray]:
+    """``unit_vec(dim)``: shared read-only all-ones unit vector, built once per dim."""
+    return _unit_vec
+
+
+# Sample axis JSON; only the name varies, so the rest is serialized once
+_AXIS_TPL = b"""{
+  "name": %s,
+  "inclusive_mode": false,
+  "plain_language_ontology": "test axis",
+  "max_examples": [
+    "maximize good",
+    "increase welfare"
+  ],
+  "min_examples": [
+    "cause harm",
+    "reduce autonomy"
+  ],
+  "weight": 1.0
+}"""
 
 
 def _make_sample_axis(path: Path, name: str):
-    data = {
-        "name": name,
-        "inclusive_mode": False,
-        "plain_language_ontology": "test axis",
-        "max_examples": [
-            "maximize good",
-            "increase welfare",
-        ],
-        "min_examples": [
-            "cause harm",
-            "reduce autonomy",
-        ],
-        "weight": 1.0,
-    }
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-
-
-@pytest.fixture(scope="module")
-def tmp_artifacts_dir() -> Iterator[Path]:
-    tmp = Path(tempfile.mkdtemp(prefix="coh_artifacts_"))
-    try:
-        os.environ["COHERENCE_ARTIFACTS_DIR"] = str(tmp)
+    if path.exists():
+        return
+    path.write_bytes(_AXIS_TPL % json.dumps(name, ensure_ascii=False).encode("utf-8"))
+
+
+@pytest.fixture(scope="session")
+def tmp_artifacts_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    # shared by every test; _reset_app_state drops active.json and frames.sqlite so
+    # neither an active pack nor ingested frames leak between tests
+    tmp = tmp_path_factory.mktemp("coh_artifacts")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("COHERENCE_ARTIFACTS_DIR", str(tmp))
         yield tmp
-    finally:
-        shutil.rmtree(tmp, ignore_errors=True)
 
 
-@pytest.fixture(scope="module")
-def sample_axis_jsons(tmp_artifacts_dir: Path) -> List[Path]:
-    a1 = tmp_artifacts_dir / "a1.json"
-    a2 = tmp_artifacts_dir / "a2.json"
+@pytest.fixture(scope="session")
+def sample_axis_jsons(tmp_path_factory: pytest.TempPathFactory) -> List[Path]:
+    # read-only inputs: written once, outside the artifacts dir
+    base = tmp_path_factory.mktemp("sample_axes")
+    a1 = base / "a1.json"
+    a2 = base / "a2.json"
     _make_sample_axis(a1, "a1")
     _make_sample_axis(a2, "a2")
     return [a1, a2]
 
 
-@pytest.fixture(scope="function")
-def api_client(tmp_artifacts_dir: Path) -> TestClient:
-    # Reset registry and load app fresh
+@pytest.fixture(scope="session")
+def _app_session(tmp_path_factory: pytest.TempPathFactory) -> Iterator[TestClient]:
+    """Create the app and its TestClient once per session.
+
+    create_app() loads the encoder and wires every router; per-test isolation
+    only needs the registry re-pointed (see _reset_app_state).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("COHERENCE_TEST_REAL_ENCODER", "1")
+        mp.setenv("COHERENCE_ENCODER", "all-mpnet-base-v2")
+        # routers that read the artifacts dir at import must never see the cwd default
+        if "COHERENCE_ARTIFACTS_DIR" not in os.environ:
+            mp.setenv("COHERENCE_ARTIFACTS_DIR", str(tmp_path_factory.mktemp("coh_session_artifacts")))
+        from coherence.api.main import create_app
+        # entered once: lifespan runs a single time and every request reuses
+        # one event-loop portal instead of starting a fresh one per call
+        with TestClient(create_app()) as client:
+            yield client
+
+
+@pytest.fixture(scope="session")
+def _session_encoder(_app_session: TestClient):
+    """The app's default encoder, resolved once (None if it cannot load).
+
+    Per-test resets reuse this instance rather than resolving it again.
+    """
+    try:
+        from coherence.encoders.text_sbert import get_default_encoder
+        return get_default_encoder()
+    except Exception as e:
+        print(f"Warning: default encoder unavailable: {e}")
+        return None
+
+
+def _reset_app_state(artifacts_dir: Path, encoder, mp: pytest.MonkeyPatch) -> None:
+    """Fresh registry rooted at artifacts_dir, as create_app() sets up on startup.
+
+    The artifacts env var goes through ``mp`` so it is restored afterwards.
+    """
     import coherence.api.axis_registry as axis_registry
-    axis_registry.REGISTRY = None
+    import coherence.api.routers.v1_axes as v1_axes
+    import coherence.api.routers.v1_frames as v1_frames
+
+    mp.setenv("COHERENCE_ARTIFACTS_DIR", str(artifacts_dir))
+    (artifacts_dir / axis_registry.ACTIVE_FILE).unlink(missing_ok=True)
+    axis_registry.reset()
+    v1_axes.REGISTRY = None  # module-level copy taken at import
+    v1_frames.reset_store()
+    # the store is closed now: start every test from an empty frames DB
+    for suffix in ("", "-wal", "-shm"):
+        (artifacts_dir / f"frames.sqlite{suffix}").unlink(missing_ok=True)
+    if encoder is None:
+        print("Warning: registry init skipped: no encoder")
+        return
+    axis_registry.init_registry(
+        encoder_dim=encoder._model.get_sentence_embedding_dimension(),
+        artifacts_dir=str(artifacts_dir),
+    )
 
-    # Set test environment variables for real encoder usage
-    os.environ["COHERENCE_ARTIFACTS_DIR"] = str(tmp_artifacts_dir)
-    os.environ["COHERENCE_TEST_REAL_ENCODER"] = "1"
-    os.environ["COHERENCE_ENCODER"] = "all-mpnet-base-v2"
 
-    from coherence.api.main import create_app
-    app = create_app()
-    client = TestClient(app)
-    return client
+@pytest.fixture(scope="function")
+def api_client(
+    _app_session: TestClient, _session_encoder, tmp_artifacts_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> TestClient:
+    # Shared app; only the registry is reset per test
+    _reset_app_state(tmp_artifacts_dir, _session_encoder, monkeypatch)
+    return _app_session
 
 
 @pytest.fixture(scope="function")
-def api_client_real_encoder(tmp_artifacts_dir: Path) -> TestClient:
+def api_client_real_encoder(
+    _app_session: TestClient, _session_encoder, tmp_artifacts_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> TestClient:
     """API client fixture that uses the real encoder (no mocking)."""
-    import coherence.api.axis_registry as axis_registry
-    axis_registry.REGISTRY = None
+    _reset_app_state(tmp_artifacts_dir, _session_encoder, monkeypatch)
+    return _app_session
+
+
+@pytest.fixture(scope="session")
+def prebuilt_pack(
+    _app_session: TestClient,
+    _session_encoder,
+    sample_axis_jsons: List[Path],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Tuple[Dict, Path]:
+    """Build the sample two-axis pack once per session.
+
+    Returns the /v1/axes/build response and the directory holding its artifacts.
+    """
+    built_dir = tmp_path_factory.mktemp("coh_prebuilt")
+    with pytest.MonkeyPatch.context() as mp:
+        _reset_app_state(built_dir, _session_encoder, mp)
+        r = _app_session.post("/v1/axes/build", json={"json_paths": [str(p) for p in sample_axis_jsons]})
+    assert r.status_code in (200, 201), r.text
+    return r.json(), built_dir
+
+
+@pytest.fixture(scope="function")
+def active_pack(api_client: TestClient, tmp_artifacts_dir: Path, prebuilt_pack: Tuple[Dict, Path]) -> Dict:
+    """Copy the prebuilt pack into this test's artifacts dir and activate it.
 
-    os.environ["COHERENCE_ARTIFACTS_DIR"] = str(tmp_artifacts_dir)
-    os.environ["COHERENCE_TEST_REAL_ENCODER"] = "1"
-    os.environ["COHERENCE_ENCODER"] = "all-mpnet-base-v2"
+    Returns the original build response (pack_id, k, ...).
+    """
+    build, built_dir = prebuilt_pack
+    pack_id = build["pack_id"]
+    for suffix in (".npz", ".meta.json"):
+        shutil.copy2(built_dir / f"axis_pack_{pack_id}{suffix}", tmp_artifacts_dir)
+    r = api_client.post(f"/v1/axes/{pack_id}/activate")
+    assert r.status_code == 200, r.text
+    return build
+
+
+@pytest.fixture(scope="function")
+def fake_active_pack(api_client: TestClient, tmp_artifacts_dir: Path) -> Dict:
+    """Write a one-axis pack straight to the artifacts dir and activate it in-process.
+
+    For tests that only need *an* active pack (ids, k, stats); skips the
+    encoder/LDA build entirely. Returns ``{"pack_id", "k"}`` like a build response.
+    """
+    import coherence.api.axis_registry as axis_registry
 
-    from coherence.api.main import create_app
-    app = create_app()
-    client = TestClient(app)
-    return client
+    reg = axis_registry.REGISTRY
+    assert reg is not None, "axis registry not initialised"
+    pack_id = "fake"
+    Q = np.zeros((reg.encoder_dim, 1), dtype=np.float32)
+    Q[0, 0] = 1.0
+    np.savez(tmp_artifacts_dir / f"axis_pack_{pack_id}.npz", Q=Q)
+    meta = {"schema_version": "axis-pack/1.1", "encoder_dim": reg.encoder_dim, "names": ["fake"]}
+    (tmp_artifacts_dir / f"axis_pack_{pack_id}.meta.json").write_text(json.dumps(meta), encoding="utf-8")
+    lp = reg.activate(pack_id)
+    return {"pack_id": pack_id, "k": lp["k"]}
@@ -1,22 +1,33 @@
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+from uuid import uuid4
 
-from coherence.memory.store import create_store
+import pytest
 
+from coherence.memory.store import FrameStore, create_store
 
-def test_store_put_and_k_infer_and_stubs():
-    db = Path(tempfile.mkdtemp()) / "frames.sqlite"
-    store = create_store(db)
+
+@pytest.fixture(scope="session")
+def memory_store(tmp_path_factory: pytest.TempPathFactory) -> FrameStore:
+    # one schema init per session; tests isolate by doc_id and frame-id prefix
+    return create_store(tmp_path_factory.mktemp("mem") / "frames.sqlite")
+
+
+@pytest.fixture
+def uid() -> str:
+    return uuid4().hex[:8]
+
+
+def test_store_put_and_k_infer_and_stubs(memory_store: FrameStore, uid: str):
+    store = memory_store
 
     frames = [
-        {"id": "f0", "predicate": [0, 1], "roles": {}, "coords": [0, 0, 0, 0, 0], "role_coords": {"predicate": [0, 0, 0, 0, 0]}},
-        {"id": "f1", "predicate": [2, 3], "roles": {}, "coords": [0.1, 0.2, 0.3, 0.4, 0.5], "role_coords": {"predicate": [1, 1, 1, 1, 1]}},
+        {"id": f"{uid}_f0", "predicate": [0, 1], "roles": {}, "coords": [0, 0, 0, 0, 0], "role_coords": {"predicate": [0, 0, 0, 0, 0]}},
+        {"id": f"{uid}_f1", "predicate": [2, 3], "roles": {}, "coords": [0.1, 0.2, 0.3, 0.4, 0.5], "role_coords": {"predicate": [1, 1, 1, 1, 1]}},
     ]
 
     ing = store.put(
-        doc_id="docA",
+        doc_id=f"doc_{uid}",
         frames=frames,
         frame_vectors=[[0.0] * (3 * 2), [1.0] * (3 * 2)],
         pack_id="packX",
@@ -29,3 +40,22 @@ def test_store_put_and_k_infer_and_stubs():
     # Search/trace smoke
     assert isinstance(store.search(axis_idx=0, min_val=-1.0, max_val=1.0, limit=10), list)
     assert isinstance(store.trace(entity_str="x", limit=10), list)
+
+
+def test_store_trace_matches_meta_in_sql(memory_store: FrameStore, uid: str):
+    store = memory_store
+    alice = f"{uid}_f_alice"
+    frames = [{"id": f"{uid}_f{i}", "predicate": [i, i + 1], "meta": {"entity": "filler"}} for i in range(5)]
+    frames.append({"id": alice, "predicate": [9, 10], "meta": {"entity": "Alice_Smith"}})
+    store.put(doc_id=f"doc_{uid}", frames=frames, frame_vectors=None, pack_id="p", pack_hash="h", k=1, d=1)
+
+    # Match lies beyond `limit` rows of the table scan and differs in case
+    assert [it["frame_id"] for it in store.trace(entity_str="alice", limit=1)] == [alice]
+    assert [it["frame_id"] for it in store.trace(entity_str="e_s", limit=10)] == [alice]
+    assert store.trace(entity_str="bob", limit=10) == []
+
+    # Upserted meta is re-indexed
+    store.put(doc_id=f"doc_{uid}", frames=[{"id": alice, "predicate": [9, 10], "meta": {"entity": "Bob"}}],
+              frame_vectors=None, pack_id="p", pack_hash="h", k=1, d=1)
+    assert [it["frame_id"] for it in store.trace(entity_str="bob", limit=10)] == [alice]
+    assert store.trace(entity_str="alice", limit=10) == []
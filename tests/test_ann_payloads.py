@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from coherence.index.ann import AnnPayloadStore
+
+
+def _payload(i, k=3, **extra):
+    rec = {
+        "doc_id": f"d{i}",
+        "text": f"span {i}",
+        "start": i,
+        "end": i + 2,
+        "alpha": [float(i)] * k,
+        "u": [float(i) + 0.5] * k,
+        "U": float(i),
+        "C": float(i) / 10,
+    }
+    rec.update(extra)
+    return rec
+
+
+def test_payload_store_grows_past_capacity():
+    store = AnnPayloadStore(k=3, capacity=2)
+    batches = [[_payload(0)], [_payload(1), _payload(2)], [_payload(i) for i in range(3, 7)]]
+    for batch in batches:
+        store.add(batch)
+    assert len(store) == 7
+
+    u = store.col("u")
+    assert u.shape == (7, 3) and u.dtype == np.float32
+    assert np.array_equal(u[:, 0], np.arange(7, dtype=np.float32) + 0.5)
+    assert np.allclose(store.col("C"), np.arange(7) / 10)
+
+    rec = store.get_payload(5)
+    assert rec == {
+        "doc_id": "d5",
+        "text": "span 5",
+        "start": 5,
+        "end": 7,
+        "alpha": [5.0] * 3,
+        "u": [5.5] * 3,
+        "r": [5.5] * 3,  # r falls back to u
+        "U": 5.0,
+        "C": pytest.approx(0.5),
+        "t": 1.0,
+        "tau": 0.0,
+    }
+    with pytest.raises(IndexError):
+        store.get_payload(7)
+
+
+def test_payload_store_drops_unknown_keys():
+    store = AnnPayloadStore(k=3)
+    store.add([_payload(0, r=[9.0] * 3, extra="ignored")])
+    rec = store[0]
+    assert rec["r"] == [9.0] * 3
+    assert "extra" not in rec
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import json
+
 import numpy as np
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -22,16 +25,24 @@ def make_axis_pack(d: int = 4, k: int = 2):
     }
 
 
-def test_resonance_with_vectors(api_client: TestClient):
-    axis = make_axis_pack(d=4, k=2)
+@pytest.fixture(scope="module")
+def axis_pack_payload():
+    # the (d=4, k=2) pack every test here posts; build and tolist() it once
+    return make_axis_pack(d=4, k=2)
+
+
+@pytest.fixture(scope="module")
+def resonance_body(axis_pack_payload) -> bytes:
+    # serialized once; posted as raw content so the client skips json encoding
     X = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]]
+    return json.dumps({"vectors": X, "axis_pack": axis_pack_payload, "return_intermediate": True}).encode()
+
+
+def test_resonance_with_vectors(api_client: TestClient, resonance_body: bytes):
     resp = api_client.post(
         "/resonance",
-        json={
-            "vectors": X,
-            "axis_pack": axis,
-            "return_intermediate": True,
-        },
+        content=resonance_body,
+        headers={"content-type": "application/json"},
     )
     assert resp.status_code == 200, resp.text
     data = resp.json()
@@ -40,8 +51,8 @@ def test_resonance_with_vectors(api_client: TestClient):
     assert "coords" in data and "utilities" in data
 
 
-def test_pipeline_analyze_with_vectors(api_client: TestClient):
-    axis = make_axis_pack(d=4, k=2)
+def test_pipeline_analyze_with_vectors(api_client: TestClient, axis_pack_payload):
+    axis = axis_pack_payload
     # 5 tokens, 4-dim vectors
     X = np.zeros((5, 4), dtype=np.float32)
     X[2, 0] = 2.0  # one salient token
@@ -59,8 +70,9 @@ def test_pipeline_analyze_with_vectors(api_client: TestClient):
     assert isinstance(data["frames"], list)
 
 
+@pytest.mark.slow
 def test_embed_endpoint_smoke(api_client: TestClient):
-    # Small smoke test with short texts; this may download a model on first run
+    # Small smoke test with short texts; this may download a model on first run (run with -m slow)
     texts = ["Hello world", "Semantic coherence"]
     resp = api_client.post(
         "/embed",
@@ -1,27 +1,35 @@
 from fastapi.testclient import TestClient
 import json, numpy as np, pathlib
+import pytest
 
+# AxisRegistry resolves both artifact naming conventions
+_SEP = {"colon": ":", "underscore": "_"}
 
-def test_activate_reads_thresholds(api_client: TestClient, tmp_artifacts_dir: pathlib.Path):
+
+@pytest.mark.parametrize("naming", ["colon", "underscore"])
+def test_activate_reads_thresholds(
+    api_client: TestClient, tmp_artifacts_dir: pathlib.Path, unit_vec, naming: str
+):
     art = tmp_artifacts_dir
     art.mkdir(parents=True, exist_ok=True)
 
-    pack_id = "thresh-pack"
+    pack_id = f"thresh-pack-{naming}"
+    stem = f"axis_pack{_SEP[naming]}{pack_id}"
     # Create a proper axis pack with Q matrix format (768D to match all-mpnet-base-v2)
-    v = np.ones(768, dtype=np.float32) / np.sqrt(768)
+    v = unit_vec(768)
     Q = v.reshape(-1, 1)  # Shape (768, 1) for single axis
     lambda_ = np.array([1.0], dtype=np.float32)
     beta = np.array([0.0], dtype=np.float32)
     weights = np.array([1.0], dtype=np.float32)
     
-    np.savez_compressed(
-        art / f"axis_pack_{pack_id}.npz", 
+    np.savez(
+        art / f"{stem}.npz", 
         Q=Q, 
         lambda_=lambda_, 
         beta=beta, 
         weights=weights
     )
-    (art / f"axis_pack_{pack_id}.meta.json").write_text(
+    (art / f"{stem}.meta.json").write_text(
         json.dumps({
             "schema_version": "axis-pack/1.1",
             "encoder_model": "all-mpnet-base-v2",
@@ -0,0 +1,56 @@
+import json, numpy as np
+from ethicalai.axes.build import build_axis_pack
+from ethicalai.axes.store import save_pack, load_pack
+
+
+def test_save_load_roundtrip_mmaps_matrix(tmp_path):
+    rng = np.random.default_rng(0)
+    pack = build_axis_pack([rng.normal(size=8) for _ in range(3)], ["a", "b", "c"], {"src": "t"})
+    pack.axes[1].threshold = 0.25
+    save_pack(pack, tmp_path)
+    loaded = load_pack(pack.id, tmp_path)
+    assert isinstance(loaded.matrix, np.memmap)
+    assert loaded.names == ["a", "b", "c"] and loaded.dim == 8
+    assert np.allclose(loaded.matrix, pack.matrix)
+    assert np.allclose(loaded.thresholds, [0.0, 0.25, 0.0])
+
+
+def test_load_legacy_npz(tmp_path):
+    v = np.ones(4, dtype=np.float32) / 2
+    np.savez_compressed(tmp_path / "axis_pack_old.npz", x=v)
+    (tmp_path / "axis_pack_old.meta.json").write_text(json.dumps({"thresholds": {"x": 0.1}}))
+    pack = load_pack("old", tmp_path)
+    assert pack.names == ["x"] and pack.dim == 4
+    assert np.allclose(pack.matrix[0], v) and np.isclose(pack.thresholds[0], 0.1)
+
+
+def test_int8_pack_dequantizes_on_load(tmp_path):
+    rng = np.random.default_rng(1)
+    pack = build_axis_pack([rng.normal(size=1024) for _ in range(64)], [f"a{i}" for i in range(64)], {})
+    save_pack(pack, tmp_path, storage="int8")
+    assert np.load(tmp_path / f"axis_pack_{pack.id}.matrix.npy", mmap_mode="r").dtype == np.int8
+    loaded = load_pack(pack.id, tmp_path)
+    assert loaded.matrix.dtype == np.float32
+    assert np.abs(loaded.matrix - pack.matrix).max() <= np.abs(pack.matrix).max() / 127
+
+
+def test_float16_pack_widens_on_load(tmp_path):
+    rng = np.random.default_rng(2)
+    pack = build_axis_pack([rng.normal(size=16) for _ in range(2)], ["a", "b"], {})
+    save_pack(pack, tmp_path, storage="float16")
+    loaded = load_pack(pack.id, tmp_path)
+    assert loaded.matrix.dtype == np.float32
+    assert np.allclose(loaded.matrix, pack.matrix, atol=1e-3)
+
+
+def test_calibrated_thresholds_survive_reload(tmp_path, monkeypatch):
+    from ethicalai.axes.calibrate import _save_thresholds
+    rng = np.random.default_rng(3)
+    pack = build_axis_pack([rng.normal(size=8) for _ in range(2)], ["a", "b"], {})
+    save_pack(pack, tmp_path)
+    pack.axes[0].threshold = 0.4
+    monkeypatch.setenv("COHERENCE_ARTIFACTS_DIR", str(tmp_path))
+    _save_thresholds(pack)
+    loaded = load_pack(pack.id, tmp_path)
+    assert loaded.names == ["a", "b"] and loaded.dim == 8
+    assert np.allclose(loaded.thresholds, [0.4, 0.0])
@@ -8,19 +8,20 @@ def test_384d_axis_pack():
     k = 2    # Number of axes
     rng = np.random.default_rng(42)
     
-    # Create synthetic seeds with 384D vectors
+    # Create synthetic seeds with 384D vectors: one (5, d) noise draw per set,
+    # biased in place along the axis' own dimension
     # axis_1 roughly along first dimension
-    pos_1 = [rng.normal(scale=0.1, size=d).astype(np.float32) for _ in range(5)]
-    pos_1 = [v + np.array([1.0] + [0.0]*(d-1)) for v in pos_1]  # Bias along first dimension
-    neg_1 = [rng.normal(scale=0.1, size=d).astype(np.float32) for _ in range(5)]
-    neg_1 = [v - np.array([1.0] + [0.0]*(d-1)) for v in neg_1]  # Bias opposite first dimension
-    
+    pos_1 = rng.normal(scale=0.1, size=(5, d)).astype(np.float32)
+    pos_1[:, 0] += 1.0
+    neg_1 = rng.normal(scale=0.1, size=(5, d)).astype(np.float32)
+    neg_1[:, 0] -= 1.0
+
     # axis_2 roughly along second dimension
-    pos_2 = [rng.normal(scale=0.1, size=d).astype(np.float32) for _ in range(5)]
-    pos_2 = [v + np.array([0.0, 1.0] + [0.0]*(d-2)) for v in pos_2]  # Bias along second dimension
-    neg_2 = [rng.normal(scale=0.1, size=d).astype(np.float32) for _ in range(5)]
-    neg_2 = [v - np.array([0.0, 1.0] + [0.0]*(d-2)) for v in neg_2]  # Bias opposite second dimension
-    
+    pos_2 = rng.normal(scale=0.1, size=(5, d)).astype(np.float32)
+    pos_2[:, 1] += 1.0
+    neg_2 = rng.normal(scale=0.1, size=(5, d)).astype(np.float32)
+    neg_2[:, 1] -= 1.0
+
     seeds_vecs = {
         "axis_1": (pos_1, neg_1),
         "axis_2": (pos_2, neg_2),
@@ -4,27 +4,25 @@ Tests all axis packs (consequentialism, deontology, virtue, etc.) and their
 integration with the ethical evaluation pipeline.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, Any, List
 import pytest
+import orjson
 from fastapi.testclient import TestClient
 
 
 class TestAxisPacksComprehensive:
     """Test all axis packs and their ethical evaluation capabilities."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def axis_packs(self):
-        """Load all available axis packs."""
+        """Load all available axis packs (parsed once per class; treat as read-only)."""
         axis_packs_dir = Path("configs/axis_packs")
         packs = {}
         
         if axis_packs_dir.exists():
             for pack_file in axis_packs_dir.glob("*.json"):
-                with open(pack_file) as f:
-                    pack_data = json.load(f)
-                    packs[pack_file.stem] = pack_data
+                packs[pack_file.stem] = orjson.loads(pack_file.read_bytes())
         
         return packs
     
@@ -1,18 +1,15 @@
 import json, os, pathlib, subprocess, sys
-from ethicalai.api.axes import ACTIVE
-from ethicalai.types import AxisPack, Axis
 import numpy as np
 
-def _make_pack(artifacts_dir, pack_id="cli-test-pack", dim=16):
+def _make_pack(artifacts_dir, v, pack_id="cli-test-pack"):
     # Simple orthonormal axis (single axis) for speed/determinism
-    v = np.ones(dim, dtype=np.float32) / np.sqrt(dim)
-    np.savez_compressed(artifacts_dir / f"axis_pack_{pack_id}.npz", autonomy=v)
+    np.savez(artifacts_dir / f"axis_pack_{pack_id}.npz", autonomy=v)
     (artifacts_dir / f"axis_pack_{pack_id}.meta.json").write_text(json.dumps({"meta": {"note":"test"}}))
     return pack_id
 
-def test_calibrate_cli_runs_and_writes_reports(tmp_path, monkeypatch, tmp_artifacts_dir):
+def test_calibrate_cli_runs_and_writes_reports(tmp_path, monkeypatch, tmp_artifacts_dir, unit_vec):
     # Ensure encoder uses fallback for CI (Phase 1 adapter should respect this automatically)
-    pack_id = _make_pack(tmp_artifacts_dir)
+    pack_id = _make_pack(tmp_artifacts_dir, unit_vec(16))
     reports = tmp_path / "reports"
     cmd = [
         sys.executable, "-m", "ethicalai.axes.calibrate",
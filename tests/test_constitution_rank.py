@@ -1,6 +1,6 @@
 import numpy as np
 from ethicalai.types import Axis, AxisPack
-from ethicalai.constitution.decoding import rank_candidates, _axis_composite
+from ethicalai.constitution.decoding import rank_candidates, _axis_composite, _matrix_composite
 
 class TinyEnc:
     """Deterministic encoder for tests:
@@ -55,3 +55,11 @@ def test_axis_composite_meaningful():
     ]
     v = _axis_composite(spans, ("autonomy","truthfulness"))
     assert abs(v - 1.0) < 1e-6
+
+def test_matrix_composite_matches_span_composite():
+    S = np.array([[2.0, 0.0, 5.0], [4.0, 1.0, -3.0]], dtype=np.float32)
+    names = ["autonomy", "truthfulness", "other"]
+    spans = [{"axis": n, "score": float(S[w, r]), "i": w, "j": w + 1, "threshold": 0.0, "breached": False}
+             for w in range(2) for r, n in enumerate(names)]
+    for pref, idx in [(("autonomy", "truthfulness"), [0, 1]), (("autonomy", "missing"), [0, None])]:
+        assert abs(_matrix_composite(S, idx) - _axis_composite(spans, pref)) < 1e-6
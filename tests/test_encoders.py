@@ -0,0 +1,26 @@
+import numpy as np
+from ethicalai.encoders import _HashEncoder
+
+
+def _small(max_tokens: int) -> _HashEncoder:
+    enc = _HashEncoder(dim=16)
+    enc._TOK_CACHE_MAX = max_tokens
+    return enc
+
+
+def test_token_cache_overflow_keeps_call_tokens():
+    enc, ref = _small(4), _HashEncoder(dim=16)
+    enc.encode_text("a b c")
+    X = enc.encode_text("a b d e")  # 5 distinct tokens > 4: evicts, must not lose "a"
+    assert np.array_equal(X, ref.encode_text("a b d e"))
+    assert len(enc._tok_cache) == 4
+    assert list(enc._tok_cache) == ["a", "b", "d", "e"]  # "c" was least recently used
+
+
+def test_encode_batch_larger_than_cache():
+    enc, ref = _small(2), _HashEncoder(dim=16)
+    texts = ["a b c", "", "d a e"]
+    out = enc.encode_batch(texts)
+    for got, t in zip(out, texts):
+        assert np.array_equal(got, ref.encode_text(t))
+    assert len(enc._tok_cache) == 2
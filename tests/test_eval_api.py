@@ -1,9 +1,9 @@
 from fastapi.testclient import TestClient
-from ethicalai.api.axes import ACTIVE
 from ethicalai.types import Axis, AxisPack
 import numpy as np
 
 def _activate_dummy_pack():
+    from ethicalai.api.axes import ACTIVE
     D = 384
     axes = [
         Axis("autonomy", np.eye(D, dtype=np.float32)[0], 999.0, {}),  # high τ to avoid breaches
@@ -1,6 +1,6 @@
 import numpy as np
 from ethicalai.types import Axis, AxisPack
-from ethicalai.eval.spans import project_scores
+from ethicalai.eval.spans import project_scores, window_means, sliding_windows, pooled
 
 def test_project_scores_shapes():
     D = 16
@@ -12,3 +12,36 @@ def test_project_scores_shapes():
     # 4 windows × 2 axes
     assert len(spans) == 8
     assert all(set(s.keys()) == {"i","j","axis","score","threshold","breached"} for s in spans)
+
+def test_window_means_match_pooled_windows():
+    X = np.random.default_rng(0).normal(size=(41, 8)).astype(np.float32)
+    ref = np.stack([pooled(X[i:j]) for i, j in sliding_windows(41, 32, 16)])  # includes ragged tail
+    assert np.allclose(window_means(X, 32, 16), ref, atol=1e-6)
+
+def test_window_means_disjoint_windows():
+    X = np.random.default_rng(1).normal(size=(23, 4)).astype(np.float32)
+    for window, stride in [(5, 5), (2, 5)]:
+        ref = np.stack([pooled(X[i:j]) for i, j in sliding_windows(23, window, stride)])
+        assert np.allclose(window_means(X, window, stride), ref, atol=1e-6)
+
+def test_minimal_veto_spans_axis_index_matches_set():
+    from ethicalai.eval.minspan import minimal_veto_spans
+    spans = [{"i": w, "j": w + 1, "axis": a, "score": 1.0, "threshold": 0.0, "breached": (w + k) % 2 == 0}
+             for w in range(4) for k, a in enumerate(["a", "b", "c"])]
+    assert minimal_veto_spans(spans, {"a": 0, "b": 1, "c": 2}) == minimal_veto_spans(spans)
+
+def test_veto_rows_match_minimal_veto_spans():
+    from ethicalai.eval.minspan import minimal_veto_spans
+    from ethicalai.eval.spans import project_span_array, span_dicts, veto_rows
+    rng = np.random.default_rng(2)
+    axes = [Axis(n, rng.normal(size=8).astype(np.float32), 0.0, {}) for n in ["a", "b", "a"]]
+    pack = AxisPack(id="t", axes=axes, dim=8, meta={})
+    arr = project_span_array(rng.normal(size=(40, 8)).astype(np.float32), pack, window=6, stride=3)
+    spans = span_dicts(arr, pack)
+    assert span_dicts(arr[veto_rows(arr, pack)], pack) == minimal_veto_spans(spans)
+
+def test_sliding_windows_bounds():
+    from ethicalai.eval.spans import sliding_windows_list
+    assert sliding_windows_list(41, 32, 16) == [(0, 32), (16, 41), (32, 41)]
+    assert sliding_windows(41, 32, 16).tolist() == [[0, 32], [16, 41], [32, 41]]
+    assert sliding_windows(0, 4, 2).shape == (0, 2)
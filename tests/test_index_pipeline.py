@@ -0,0 +1,78 @@
+import numpy as np
+
+from coherence.axis.pack import AxisPack
+from coherence.index import pipeline
+
+
+class _CountingEncoder:
+    model_name = "counting-test"
+    normalize_input = False
+
+    class _model:
+        @staticmethod
+        def get_sentence_embedding_dimension() -> int:
+            return 4
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def encode(self, texts):
+        self.calls += 1
+        rng = np.random.default_rng(len(texts))
+        return rng.standard_normal((len(texts), 4)).astype(np.float32)
+
+
+def _write_pack(root, pack_id):
+    k, d = 2, 4
+    pack = AxisPack(
+        names=["a0", "a1"],
+        Q=np.eye(d, k, dtype=np.float32),
+        lambda_=np.ones(k, dtype=np.float32),
+        beta=np.zeros(k, dtype=np.float32),
+        weights=np.full(k, 0.5, dtype=np.float32),
+        mu={},
+        meta={},
+    )
+    (root / "data" / "axes").mkdir(parents=True)
+    pack.save(root / "data" / "axes" / f"{pack_id}.json")
+
+
+def test_run_index_reuses_cached_embeddings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("COHERENCE_ARTIFACTS_DIR", str(tmp_path / "artifacts"))
+    _write_pack(tmp_path, "ap_cache")
+    enc = _CountingEncoder()
+    monkeypatch.setattr(pipeline, "get_encoder", lambda: enc)
+    docs = [{"doc_id": "d1", "text": "one two three"}, {"doc_id": "d2", "text": "four five"}]
+
+    first = pipeline.run_index("ap_cache", docs, {"workers": 1})
+    assert first["indexed"] == ["d1", "d2"] and enc.calls == 2
+    cached = sorted((tmp_path / "artifacts" / "cache" / "embeddings").iterdir())
+    assert len(cached) == 2 and all(p.suffix == ".npy" for p in cached)  # no .tmp leftovers
+
+    second = pipeline.run_index("ap_cache", docs, {"workers": 1})
+    assert second["indexed"] == ["d1", "d2"] and enc.calls == 2
+
+
+def test_text_key_depends_on_encoder_setup():
+    base = pipeline._text_key("hello world", "simple_split", "m", False, 4)
+    assert base == pipeline._text_key("hello world", "simple_split", "m", False, 4)
+    assert base != pipeline._text_key("hello world", "simple_split", "m", True, 4)
+    assert base != pipeline._text_key("hello world", "simple_split", "m", False, 8)
+
+
+def test_run_index_without_cache_always_encodes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("COHERENCE_ARTIFACTS_DIR", str(tmp_path / "artifacts"))
+    _write_pack(tmp_path, "ap_nocache")
+    enc = _CountingEncoder()
+    monkeypatch.setattr(pipeline, "get_encoder", lambda: enc)
+    cfg = pipeline.load_app_config()
+    cfg["index"]["embedding_cache"] = False
+    monkeypatch.setattr(pipeline, "load_app_config", lambda: cfg)
+    docs = [{"doc_id": "d1", "text": "one two three"}]
+
+    pipeline.run_index("ap_nocache", docs, {"workers": 1})
+    pipeline.run_index("ap_nocache", docs, {"workers": 1})
+    assert enc.calls == 2
+    assert not (tmp_path / "artifacts" / "cache").exists()
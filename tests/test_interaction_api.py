@@ -1,11 +1,11 @@
 from fastapi.testclient import TestClient
-from ethicalai.api.axes import ACTIVE
 from ethicalai.types import AxisPack, Axis
 import numpy as np
 
 
 def _activate_dummy_pack(dim=16):
     # Minimal axis pack to let the endpoint run
+    from ethicalai.api.axes import ACTIVE
     axes = [Axis(name="autonomy", vector=np.ones(dim)/np.sqrt(dim), threshold=999.0, provenance={})]
     ACTIVE["pack"] = AxisPack(id="test", axes=axes, dim=dim, meta={})
 
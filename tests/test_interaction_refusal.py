@@ -1,11 +1,11 @@
 from fastapi.testclient import TestClient
-from ethicalai.api.axes import ACTIVE
 from ethicalai.types import AxisPack, Axis
 import numpy as np
 
 
 def _activate_low_threshold_pack(dim=16):
     # Very low threshold to force veto
+    from ethicalai.api.axes import ACTIVE
     axes = [Axis(name="autonomy", vector=np.ones(dim)/np.sqrt(dim), threshold=-999.0, provenance={})]
     ACTIVE["pack"] = AxisPack(id="test2", axes=axes, dim=dim, meta={})
 
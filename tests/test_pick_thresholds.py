@@ -0,0 +1,33 @@
+import numpy as np
+from ethicalai.types import Axis, AxisPack
+from ethicalai.axes.calibrate import pick_thresholds
+
+def _reference_tau(pts, fpr_max):
+    pts = sorted(pts)
+    best_tau, best_f1 = 0.0, -1.0
+    for tau in [p[0] for p in pts]:
+        tp = sum(1 for s,l in pts if s>tau and l==1)
+        fp = sum(1 for s,l in pts if s>tau and l==0)
+        fn = sum(1 for s,l in pts if s<=tau and l==1)
+        tn = sum(1 for s,l in pts if s<=tau and l==0)
+        if fp / max(fp+tn,1) <= fpr_max:
+            prec = tp / max(tp+fp,1)
+            rec  = tp / max(tp+fn,1)
+            f1   = 2*prec*rec / max(prec+rec,1e-12)
+            if f1 > best_f1:
+                best_f1, best_tau = f1, tau
+    return best_tau
+
+def test_pick_thresholds_matches_reference_sweep():
+    rng = np.random.default_rng(0)
+    for trial in range(20):
+        n = int(rng.integers(1, 60))
+        labels = rng.integers(0, 2, size=n)
+        raw = rng.normal(size=n) + labels
+        # quantize some trials to force tied scores
+        s = np.round(raw, 1) if trial % 2 else raw
+        pts = [(float(a), int(b)) for a, b in zip(s, labels)]
+        for fpr_max in (0.0, 0.05, 0.3):
+            pack = AxisPack(id="t", axes=[Axis("a", np.zeros(2, np.float32), 0.0, {})], dim=2, meta={})
+            pick_thresholds(pack, {"a": pts}, fpr_max=fpr_max)
+            assert pack.axes[0].threshold == _reference_tau(pts, fpr_max)
@@ -1,3 +1,4 @@
+import pytest
 from ethicalai.constitution.regularizer import regularizer_numpy
 
 def test_regularizer_numpy_basic():
@@ -11,3 +12,38 @@ def test_regularizer_numpy_basic():
     assert val > 0.0
     # Simple sanity range check
     assert val < 1.0
+
+
+def test_regularizer_torch_matches_numpy_and_falls_back_to_eager(monkeypatch):
+    torch = pytest.importorskip("torch")
+    from ethicalai.constitution import regularizer as reg
+
+    span_scores = {"autonomy": [(0.2, 0.0), (0.1, 0.0)], "risk": [(1.5, 1.0)]}
+    weights = {"autonomy": 0.5, "risk": 2.0}
+    expected = regularizer_numpy(span_scores, weights, lam=0.1)
+    as_t = {a: [(torch.tensor(s), torch.tensor(t)) for s, t in items] for a, items in span_scores.items()}
+    assert float(reg.regularizer_torch(as_t, weights, lam=0.1)) == pytest.approx(expected, rel=1e-6)
+
+    class _CompileFailed(Exception):
+        pass
+
+    def _broken(*_args):
+        raise _CompileFailed()
+
+    monkeypatch.setattr(reg, "_HINGE", _broken)
+    monkeypatch.setattr(reg, "_backend_failures", lambda: (_CompileFailed,))
+    assert float(reg.regularizer_torch(as_t, weights, lam=0.1)) == pytest.approx(expected, rel=1e-6)
+    assert reg._HINGE is reg._hinge_eager
+
+
+def test_regularizer_torch_vector_scores_scalar_tau():
+    torch = pytest.importorskip("torch")
+    from ethicalai.constitution.regularizer import regularizer_torch
+
+    # per-token scores (d=3) with a scalar tau per span; N=3 spans so N == d
+    spans = [([0.5, 0.0, 2.0], 1.0), ([1.5, 1.5, 1.5], 0.5), ([0.0, 3.0, 0.0], 2.0)]
+    span_scores = {"risk": [(torch.tensor(s), torch.tensor(t)) for s, t in spans]}
+    out = regularizer_torch(span_scores, {"risk": 2.0}, lam=0.1)
+    expected = 0.1 * 2.0 * sum(torch.clamp(torch.tensor(s) - t, min=0.0) for s, t in spans)
+    assert out.shape == (3,)
+    assert torch.allclose(out, expected)
@@ -2,7 +2,8 @@ import pytest
 import numpy as np
 
 from coherence.axis.pack import AxisPack
-from coherence.metrics.resonance import project, utilities, aggregate, resonance
+from coherence.axis.choquet import capacity_table, choquet_integral, choquet_integral_batch
+from coherence.metrics.resonance import project, utilities, aggregate, resonance, axis_utilities
 
 def make_pack_linear(k=2, d=4):
     Q = np.zeros((d, k), dtype=np.float32)
@@ -60,3 +61,28 @@ def test_resonance_choquet_two_axes():
     # total = 1.0 + 1*0.3 = 1.3
     val = aggregate(u, pack)
     assert np.isclose(val, 1.3, atol=1e-6)
+
+    # Reassigning mu must drop the cached capacity table
+    assert pack.mu_table is not None
+    pack.mu = {frozenset({0}): 0.6, frozenset({1}): 0.4, frozenset({0, 1}): 1.0}
+    assert np.isclose(aggregate(u, pack), 1.0 + 0.6, atol=1e-6)
+
+
+def test_choquet_batch_matches_scalar():
+    k = 4
+    rng = np.random.default_rng(3)
+    mu = {frozenset(b for b in range(k) if (m >> b) & 1): m / 15.0 for m in range(1, 16)}
+    X = rng.integers(0, 4, size=(32, k)).astype(np.float32)  # many ties
+    X[:8] = rng.standard_normal((8, k)).astype(np.float32)
+    batch = choquet_integral_batch(X, capacity_table(mu, k))
+    expected = np.array([choquet_integral(row.tolist(), mu) for row in X])
+    assert np.allclose(batch, expected, atol=1e-6)
+
+
+def test_axis_utilities_matches_unfused_path():
+    pack = make_pack_linear()
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((5, 4)).astype(np.float32)
+    U = axis_utilities(X, pack)
+    assert U.shape == (5, 2) and U.dtype == np.float32
+    assert np.array_equal(U, utilities(project(X, pack), pack))